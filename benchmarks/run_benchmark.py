@@ -18,14 +18,24 @@ Results are printed as a formatted table and saved to benchmarks/results.json.
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import sys
 import time
-from dataclasses import asdict, dataclass, field
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Callable, Coroutine
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Coroutine, Final
 
-from playwright.async_api import Browser, Page, async_playwright
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    # Playwright is imported lazily inside the functions that need it at runtime
+    from playwright.async_api import Browser, Page
 
 # Allow running from repo root without installing
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -45,7 +55,7 @@ _TOKEN_BUDGET = 32_768
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     step_num: int           # 1-based
     label: str              # human description of this step
@@ -61,30 +71,39 @@ class StepResult:
     skip_reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SiteResult:
     site_name: str
     url: str
     steps: list[StepResult] = field(default_factory=list)
     skipped: bool = False
     skip_reason: str = ""
+    # Running totals maintained by add_step() so reporting never rescans steps
+    _total_raw: int = field(default=0, init=False, repr=False)
+    _total_lens: int = field(default=0, init=False, repr=False)
+
+    def add_step(self, step: StepResult) -> None:
+        self.steps.append(step)
+        if not step.skipped:
+            self._total_raw += step.raw_tokens
+            self._total_lens += step.lens_tokens
 
     @property
     def total_raw(self) -> int:
-        return sum(s.raw_tokens for s in self.steps if not s.skipped)
+        return self._total_raw
 
     @property
     def total_lens(self) -> int:
-        return sum(s.lens_tokens for s in self.steps if not s.skipped)
+        return self._total_lens
 
     @property
     def overall_reduction_pct(self) -> float:
-        if self.total_raw == 0:
+        if self._total_raw == 0:
             return 0.0
-        return (1 - self.total_lens / self.total_raw) * 100
+        return (1 - self._total_lens / self._total_raw) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkReport:
     sites: list[SiteResult] = field(default_factory=list)
     ran_at: str = ""
@@ -109,12 +128,23 @@ class BenchmarkReport:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-async def _raw_tokens(page: Page) -> int:
-    """Baseline: token count of Playwright's aria_snapshot YAML."""
-    yaml = await page.locator("body").aria_snapshot()
+# Serializes lens.observe() across the concurrently running workflows
+_OBSERVE_LOCK = asyncio.Lock()
+
+# Distinct snapshots whose token counts are kept for reuse
+_RAW_CACHE_SIZE = 32
+
+
+@functools.lru_cache(maxsize=_RAW_CACHE_SIZE)
+def _snapshot_tokens(yaml: str) -> int:
     return _BUDGET.count(yaml)
 
 
+async def _raw_tokens(page: Page) -> int:
+    """Baseline: token count of Playwright's aria_snapshot YAML; repeated snapshots are tokenized once."""
+    return _snapshot_tokens(await page.locator("body").aria_snapshot())
+
+
 async def _observe_step(
     lens: BrowserLens,
     page: Page,
@@ -122,8 +152,12 @@ async def _observe_step(
     step_num: int,
 ) -> StepResult:
     """Run lens.observe() and collect all metrics for one step."""
+    # observe() runs on its own, and never alongside another workflow's
+    # observe(), so latency_ms measures it without contention; the baseline
+    # snapshot is taken afterwards
+    async with _OBSERVE_LOCK:
+        result = await lens.observe(page)
     raw = await _raw_tokens(page)
-    result = await lens.observe(page)
 
     reduction = (1 - result.token_count / max(raw, 1)) * 100
     # is_delta=False when diff was discarded (URL change or token fallback) even if delta exists
@@ -135,7 +169,7 @@ async def _observe_step(
 
     return StepResult(
         step_num=step_num,
-        label=label,
+        label=label[:_LABEL_W],  # truncated once for the report column
         url=page.url,
         raw_tokens=raw,
         lens_tokens=result.token_count,
@@ -150,7 +184,7 @@ async def _observe_step(
 def _skipped_step(step_num: int, label: str, url: str, reason: str) -> StepResult:
     return StepResult(
         step_num=step_num,
-        label=label,
+        label=label[:_LABEL_W],
         url=url,
         raw_tokens=0,
         lens_tokens=0,
@@ -163,16 +197,29 @@ def _skipped_step(step_num: int, label: str, url: str, reason: str) -> StepResul
     )
 
 
-async def _fresh_page(browser: Browser) -> Page:
-    ctx = await browser.new_context(
-        viewport={"width": 1280, "height": 800},
-        user_agent=(
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/122.0.0.0 Safari/537.36"
-        ),
-    )
-    return await ctx.new_page()
+_CONTEXT_OPTIONS = {
+    "viewport": {"width": 1280, "height": 800},
+    "user_agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/122.0.0.0 Safari/537.36"
+    ),
+}
+
+@asynccontextmanager
+async def _open_page(browser: Browser) -> AsyncIterator[Page]:
+    """
+    Open a page in a fresh context and close the context on exit.
+
+    Each workflow gets its own context, so cookies and local/session storage
+    (Sauce Demo keeps its cart there) never leak between sites. The workflows
+    run concurrently, so their context start-ups already overlap.
+    """
+    ctx = await browser.new_context(**_CONTEXT_OPTIONS)
+    try:
+        yield await ctx.new_page()
+    finally:
+        await ctx.close()
 
 
 async def _safe_goto(page: Page, url: str, *, timeout: int = 20_000) -> bool:
@@ -185,6 +232,24 @@ async def _safe_goto(page: Page, url: str, *, timeout: int = 20_000) -> bool:
         return False
 
 
+async def _settle_after_goto(page: Page, *, timeout: int = 5_000) -> None:
+    """
+    Best-effort network-idle wait after the initial navigation.
+
+    Post-action steps wait for the specific result of the click (the URL it
+    routes to, or the element it reveals) instead: the SPA sites here change
+    routes without a new document load, and observe() only needs the DOM,
+    which is ready long before third-party analytics pings stop. Timing out
+    here is not an error.
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Workflow 1 — Practice Test Automation login
 # ─────────────────────────────────────────────────────────────────────────────
@@ -195,43 +260,41 @@ async def run_login_workflow(browser: Browser) -> SiteResult:
         site_name="Practice Test Automation — Login",
         url="https://practicetestautomation.com/practice-test-login/",
     )
-    page = await _fresh_page(browser)
     lens = BrowserLens(token_budget=_TOKEN_BUDGET)
 
-    try:
-        # Step 1 — navigate & observe blank form
-        ok = await _safe_goto(page, site.url)
-        if not ok:
+    async with _open_page(browser) as page:
+        try:
+            # Step 1 — navigate & observe blank form
+            ok = await _safe_goto(page, site.url)
+            if not ok:
+                site.skipped = True
+                site.skip_reason = "Navigation failed"
+                return site
+            await _settle_after_goto(page)
+            site.add_step(await _observe_step(lens, page, "Navigate to login page", 1))
+
+            # Step 2 — fill username
+            await page.fill("#username", "student")
+            site.add_step(await _observe_step(lens, page, "Fill username field", 2))
+
+            # Step 3 — fill password
+            await page.fill("#password", "Password123")
+            site.add_step(await _observe_step(lens, page, "Fill password field", 3))
+
+            # Step 4 — click Login
+            await page.click("#submit")
+            await page.wait_for_url("**/logged-in-successfully/", timeout=15_000)
+            site.add_step(await _observe_step(lens, page, "Click Login → success page", 4))
+
+            # Verify success (non-fatal)
+            success_text = await page.locator("h1, .post-title, #loop-container").first.text_content(timeout=5_000)
+            if success_text:
+                print(f"    [verified] success page: {success_text.strip()!r}")
+
+        except Exception as exc:
+            print(f"    [workflow error] {exc}")
             site.skipped = True
-            site.skip_reason = "Navigation failed"
-            return site
-        await page.wait_for_load_state("networkidle", timeout=15_000)
-        site.steps.append(await _observe_step(lens, page, "Navigate to login page", 1))
-
-        # Step 2 — fill username
-        await page.fill("#username", "student")
-        site.steps.append(await _observe_step(lens, page, "Fill username field", 2))
-
-        # Step 3 — fill password
-        await page.fill("#password", "Password123")
-        site.steps.append(await _observe_step(lens, page, "Fill password field", 3))
-
-        # Step 4 — click Login
-        await page.click("#submit")
-        await page.wait_for_load_state("networkidle", timeout=15_000)
-        site.steps.append(await _observe_step(lens, page, "Click Login → success page", 4))
-
-        # Verify success (non-fatal)
-        success_text = await page.locator("h1, .post-title, #loop-container").first.text_content(timeout=5_000)
-        if success_text:
-            print(f"    [verified] success page: {success_text.strip()!r}")
-
-    except Exception as exc:
-        print(f"    [workflow error] {exc}")
-        site.skipped = True
-        site.skip_reason = str(exc)
-    finally:
-        await page.context.close()
+            site.skip_reason = str(exc)
 
     return site
 
@@ -246,58 +309,58 @@ async def run_saucedemo_workflow(browser: Browser) -> SiteResult:
         site_name="Sauce Demo — Login → Product → Cart",
         url="https://www.saucedemo.com/",
     )
-    page = await _fresh_page(browser)
     lens = BrowserLens(token_budget=_TOKEN_BUDGET)
 
-    try:
-        # Step 1 — navigate
-        ok = await _safe_goto(page, site.url)
-        if not ok:
-            site.skipped = True
-            site.skip_reason = "Navigation failed"
-            return site
-        await page.wait_for_load_state("networkidle", timeout=15_000)
-        site.steps.append(await _observe_step(lens, page, "Navigate to Sauce Demo", 1))
-
-        # Step 2 — fill username
-        await page.fill("#user-name", "standard_user")
-        site.steps.append(await _observe_step(lens, page, "Fill username", 2))
-
-        # Step 3 — fill password
-        await page.fill("#password", "secret_sauce")
-        site.steps.append(await _observe_step(lens, page, "Fill password", 3))
-
-        # Step 4 — click Login
-        await page.click("#login-button")
-        await page.wait_for_load_state("networkidle", timeout=15_000)
-        site.steps.append(await _observe_step(lens, page, "Click Login → products page", 4))
-
-        # Step 5 — click first product title
-        first_product = page.locator(".inventory_item_name").first
-        await first_product.wait_for(timeout=10_000)
-        await first_product.click()
-        await page.wait_for_load_state("networkidle", timeout=10_000)
-        site.steps.append(await _observe_step(lens, page, "Click first product", 5))
-
-        # Step 6 — click Add to Cart
-        add_btn = page.locator("button.btn_primary.btn_inventory, button[data-test*='add-to-cart']").first
-        await add_btn.wait_for(timeout=10_000)
-        await add_btn.click()
-        site.steps.append(await _observe_step(lens, page, "Click Add to Cart", 6))
-
-        # Step 7 — click cart icon
-        await page.locator(".shopping_cart_link").click()
-        await page.wait_for_load_state("networkidle", timeout=10_000)
-        site.steps.append(await _observe_step(lens, page, "Click cart icon → cart page", 7))
-
-    except Exception as exc:
-        print(f"    [workflow error] {exc}")
-        # Append a skipped marker for steps not reached
-        reached = len(site.steps) + 1
-        for i in range(reached, 8):
-            site.steps.append(_skipped_step(i, f"Step {i} (not reached)", page.url, str(exc)))
-    finally:
-        await page.context.close()
+    async with _open_page(browser) as page:
+        try:
+            # Step 1 — navigate
+            ok = await _safe_goto(page, site.url)
+            if not ok:
+                site.skipped = True
+                site.skip_reason = "Navigation failed"
+                return site
+            await _settle_after_goto(page)
+            site.add_step(await _observe_step(lens, page, "Navigate to Sauce Demo", 1))
+
+            # Step 2 — fill username
+            await page.fill("#user-name", "standard_user")
+            site.add_step(await _observe_step(lens, page, "Fill username", 2))
+
+            # Step 3 — fill password
+            await page.fill("#password", "secret_sauce")
+            site.add_step(await _observe_step(lens, page, "Fill password", 3))
+
+            # Step 4 — click Login
+            await page.click("#login-button")
+            await page.wait_for_url("**/inventory.html", timeout=15_000)
+            site.add_step(await _observe_step(lens, page, "Click Login → products page", 4))
+
+            # Step 5 — click first product title
+            # page.click auto-waits for the first match, so no separate wait_for round-trip
+            await page.click(".inventory_item_name", timeout=10_000)
+            await page.wait_for_url("**/inventory-item.html**", timeout=10_000)
+            site.add_step(await _observe_step(lens, page, "Click first product", 5))
+
+            # Step 6 — click Add to Cart
+            await page.click(
+                "button.btn_primary.btn_inventory, button[data-test*='add-to-cart']",
+                timeout=10_000,
+            )
+            # The button re-renders as "Remove" once the item is in the cart
+            await page.locator("button[data-test^='remove']").first.wait_for(timeout=10_000)
+            site.add_step(await _observe_step(lens, page, "Click Add to Cart", 6))
+
+            # Step 7 — click cart icon
+            await page.locator(".shopping_cart_link").click()
+            await page.wait_for_url("**/cart.html", timeout=10_000)
+            site.add_step(await _observe_step(lens, page, "Click cart icon → cart page", 7))
+
+        except Exception as exc:
+            print(f"    [workflow error] {exc}")
+            # Append a skipped marker for steps not reached
+            reached = len(site.steps) + 1
+            for i in range(reached, 8):
+                site.add_step(_skipped_step(i, f"Step {i} (not reached)", page.url, str(exc)))
 
     return site
 
@@ -312,47 +375,43 @@ async def run_dynamic_loading_workflow(browser: Browser) -> SiteResult:
         site_name="The Internet — Dynamic Loading",
         url="https://the-internet.herokuapp.com/dynamic_loading/1",
     )
-    page = await _fresh_page(browser)
     lens = BrowserLens(token_budget=_TOKEN_BUDGET)
 
-    try:
-        # Step 1 — navigate
-        ok = await _safe_goto(page, site.url)
-        if not ok:
-            site.skipped = True
-            site.skip_reason = "Navigation failed"
-            return site
-        await page.wait_for_load_state("networkidle", timeout=15_000)
-        site.steps.append(await _observe_step(lens, page, "Navigate to dynamic loading page", 1))
-
-        # Step 2 — click Start
-        start_btn = page.get_by_role("button", name="Start")
-        await start_btn.wait_for(timeout=10_000)
-        await start_btn.click()
-        site.steps.append(await _observe_step(lens, page, "Click Start (loading begins)", 2))
-
-        # Step 3 — wait for loading indicator to appear
-        loading = page.locator("#loading")
-        await loading.wait_for(state="visible", timeout=10_000)
-        site.steps.append(await _observe_step(lens, page, "Loading spinner visible", 3))
-
-        # Step 4 — wait for finish text to appear
-        finish = page.locator("#finish")
-        await finish.wait_for(state="visible", timeout=15_000)
-        site.steps.append(await _observe_step(lens, page, "Loading complete — result visible", 4))
-
-        # Read and print result text (non-fatal)
-        result_text = await finish.text_content(timeout=5_000)
-        if result_text:
-            print(f"    [verified] result: {result_text.strip()!r}")
-
-    except Exception as exc:
-        print(f"    [workflow error] {exc}")
-        reached = len(site.steps) + 1
-        for i in range(reached, 5):
-            site.steps.append(_skipped_step(i, f"Step {i} (not reached)", page.url, str(exc)))
-    finally:
-        await page.context.close()
+    async with _open_page(browser) as page:
+        try:
+            # Step 1 — navigate
+            ok = await _safe_goto(page, site.url)
+            if not ok:
+                site.skipped = True
+                site.skip_reason = "Navigation failed"
+                return site
+            await _settle_after_goto(page)
+            site.add_step(await _observe_step(lens, page, "Navigate to dynamic loading page", 1))
+
+            # Step 2 — click Start
+            await page.click("role=button[name='Start']", timeout=10_000)
+            site.add_step(await _observe_step(lens, page, "Click Start (loading begins)", 2))
+
+            # Step 3 — wait for loading indicator to appear
+            loading = page.locator("#loading")
+            await loading.wait_for(state="visible", timeout=10_000)
+            site.add_step(await _observe_step(lens, page, "Loading spinner visible", 3))
+
+            # Step 4 — wait for finish text to appear
+            finish = page.locator("#finish")
+            await finish.wait_for(state="visible", timeout=15_000)
+            site.add_step(await _observe_step(lens, page, "Loading complete — result visible", 4))
+
+            # Read and print result text (non-fatal)
+            result_text = await finish.text_content(timeout=5_000)
+            if result_text:
+                print(f"    [verified] result: {result_text.strip()!r}")
+
+        except Exception as exc:
+            print(f"    [workflow error] {exc}")
+            reached = len(site.steps) + 1
+            for i in range(reached, 5):
+                site.add_step(_skipped_step(i, f"Step {i} (not reached)", page.url, str(exc)))
 
     return site
 
@@ -361,7 +420,7 @@ async def run_dynamic_loading_workflow(browser: Browser) -> SiteResult:
 # Report rendering
 # ─────────────────────────────────────────────────────────────────────────────
 
-_COL_WIDTHS = {
+_COL_WIDTHS: Final[dict[str, int]] = {
     "step":    4,
     "label":  36,
     "raw":     8,
@@ -371,65 +430,61 @@ _COL_WIDTHS = {
     "mode":    9,
     "rep":    14,
 }
-_DIVIDER = (
-    "─" * (_COL_WIDTHS["step"] + 2) + "┼" +
-    "─" * (_COL_WIDTHS["label"] + 2) + "┼" +
-    "─" * (_COL_WIDTHS["raw"] + 2) + "┼" +
-    "─" * (_COL_WIDTHS["lens"] + 2) + "┼" +
-    "─" * (_COL_WIDTHS["red"] + 2) + "┼" +
-    "─" * (_COL_WIDTHS["lat"] + 2) + "┼" +
-    "─" * (_COL_WIDTHS["mode"] + 2) + "┼" +
-    "─" * (_COL_WIDTHS["rep"] + 2)
+_LABEL_W = _COL_WIDTHS["label"]
+# One "┼" inside each two-space column gap, so the divider spans exactly the row width
+_DIVIDER: Final = "─┼".join("─" * w for w in _COL_WIDTHS.values())
+
+
+# Row templates with the column widths baked in, built once at import.
+# Text cells in the skipped/header rows share _TEXT_ROW_FMT; measured rows
+# format latency as a number.
+_TEXT_ROW_FMT = (
+    f"{{step:>{_COL_WIDTHS['step']}}}  "
+    f"{{label:<{_LABEL_W}}}  "
+    f"{{raw:>{_COL_WIDTHS['raw']}}}  "
+    f"{{lens:>{_COL_WIDTHS['lens']}}}  "
+    f"{{red:>{_COL_WIDTHS['red']}}}  "
+    f"{{lat:>{_COL_WIDTHS['lat']}}}  "
+    f"{{mode:<{_COL_WIDTHS['mode']}}}  "
+    f"{{rep:<{_COL_WIDTHS['rep']}}}"
+)
+_STEP_ROW_FMT = _TEXT_ROW_FMT.replace(
+    f"{{lat:>{_COL_WIDTHS['lat']}}}", f"{{lat:>{_COL_WIDTHS['lat']}.0f}}"
+)
+_HEADER_ROW = _TEXT_ROW_FMT.format(
+    step="#", label="Step", raw="Raw tk", lens="Lens tk",
+    red="Saving", lat="Lat ms", mode="Mode", rep="Repr",
 )
 
 
 def _header_row() -> str:
-    return (
-        f"{'#':>{_COL_WIDTHS['step']}}  "
-        f"{'Step':<{_COL_WIDTHS['label']}}  "
-        f"{'Raw tk':>{_COL_WIDTHS['raw']}}  "
-        f"{'Lens tk':>{_COL_WIDTHS['lens']}}  "
-        f"{'Saving':>{_COL_WIDTHS['red']}}  "
-        f"{'Lat ms':>{_COL_WIDTHS['lat']}}  "
-        f"{'Mode':<{_COL_WIDTHS['mode']}}  "
-        f"{'Repr':<{_COL_WIDTHS['rep']}}"
-    )
+    return _HEADER_ROW
 
 
 def _step_row(s: StepResult) -> str:
     if s.skipped:
-        label = f"{s.label[:_COL_WIDTHS['label']]:<{_COL_WIDTHS['label']}}"
-        return (
-            f"{s.step_num:>{_COL_WIDTHS['step']}}  "
-            f"{label}  "
-            f"{'—':>{_COL_WIDTHS['raw']}}  "
-            f"{'—':>{_COL_WIDTHS['lens']}}  "
-            f"{'—':>{_COL_WIDTHS['red']}}  "
-            f"{'—':>{_COL_WIDTHS['lat']}}  "
-            f"{'skip':<{_COL_WIDTHS['mode']}}  "
-            f"{'—':<{_COL_WIDTHS['rep']}}"
+        return _TEXT_ROW_FMT.format(
+            step=s.step_num, label=s.label,
+            raw="—", lens="—", red="—", lat="—", mode="skip", rep="—",
         )
 
     # Colour-code reduction:  positive = savings (good), negative = overhead
-    pct = s.reduction_pct
-    pct_str = f"{pct:+.1f}%"
     if s.is_delta:
         mode = "delta"
     elif s.diff_discarded:
         mode = "full*"   # full state chosen because URL changed or delta > full state
     else:
         mode = "full"
-    label = s.label[:_COL_WIDTHS["label"]]
 
-    return (
-        f"{s.step_num:>{_COL_WIDTHS['step']}}  "
-        f"{label:<{_COL_WIDTHS['label']}}  "
-        f"{s.raw_tokens:>{_COL_WIDTHS['raw']}}  "
-        f"{s.lens_tokens:>{_COL_WIDTHS['lens']}}  "
-        f"{pct_str:>{_COL_WIDTHS['red']}}  "
-        f"{s.latency_ms:>{_COL_WIDTHS['lat']}.0f}  "
-        f"{mode:<{_COL_WIDTHS['mode']}}  "
-        f"{s.representation:<{_COL_WIDTHS['rep']}}"
+    return _STEP_ROW_FMT.format(
+        step=s.step_num,
+        label=s.label,
+        raw=s.raw_tokens,
+        lens=s.lens_tokens,
+        red=f"{s.reduction_pct:+.1f}%",
+        lat=s.latency_ms,
+        mode=mode,
+        rep=s.representation,
     )
 
 
@@ -449,37 +504,45 @@ def print_report(report: BenchmarkReport) -> None:
     bar = "═" * 90
     thin = "─" * 90
 
-    print(f"\n{bar}")
-    print(f"  BROWSERLENS BENCHMARK REPORT")
-    print(f"  {report.ran_at}")
-    print(f"{bar}\n")
+    # Build the whole report and emit it with a single write
+    lines = [
+        "",
+        bar,
+        "  BROWSERLENS BENCHMARK REPORT",
+        f"  {report.ran_at}",
+        bar,
+        "",
+    ]
 
     for site in report.sites:
-        print(f"  ▶  {site.site_name}")
-        print(f"     {site.url}")
+        lines.append(f"  ▶  {site.site_name}")
+        lines.append(f"     {site.url}")
 
         if site.skipped:
-            print(f"     [SKIPPED] {site.skip_reason}\n")
+            lines.append(f"     [SKIPPED] {site.skip_reason}")
+            lines.append("")
             continue
 
-        print()
-        print(f"  {_header_row()}")
-        print(f"  {_DIVIDER}")
-        for step in site.steps:
-            print(f"  {_step_row(step)}")
-        print(f"  {thin}")
-        print(f"  {_site_total_row(site)}")
-        print()
+        lines.append("")
+        lines.append(f"  {_header_row()}")
+        lines.append(f"  {_DIVIDER}")
+        lines.extend(f"  {_step_row(step)}" for step in site.steps)
+        lines.append(f"  {thin}")
+        lines.append(f"  {_site_total_row(site)}")
+        lines.append("")
 
-    print(f"{bar}")
+    lines.append(bar)
     if report.grand_raw > 0:
-        print(
+        lines.append(
             f"  GRAND TOTAL  "
             f"raw={report.grand_raw:,} tokens  "
             f"lens={report.grand_lens:,} tokens  "
             f"overall reduction={report.grand_reduction_pct:+.1f}%"
         )
-    print(f"{bar}\n")
+    lines.append(bar)
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -487,6 +550,15 @@ def print_report(report: BenchmarkReport) -> None:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+# StepResult fields are all primitives, so a flat field read replaces asdict()'s
+# recursive deep copy
+_STEP_FIELDS = tuple(f.name for f in fields(StepResult))
+
+
+def _step_to_dict(step: StepResult) -> dict:
+    return {name: getattr(step, name) for name in _STEP_FIELDS}
+
+
 def _to_json(report: BenchmarkReport) -> dict:
     return {
         "ran_at": report.ran_at,
@@ -506,13 +578,24 @@ def _to_json(report: BenchmarkReport) -> dict:
                     "lens_tokens": s.total_lens,
                     "reduction_pct": round(s.overall_reduction_pct, 2),
                 },
-                "steps": [asdict(step) for step in s.steps],
+                "steps": [_step_to_dict(step) for step in s.steps],
             }
             for s in report.sites
         ],
     }
 
 
+def _write_results(report: BenchmarkReport) -> None:
+    """Write the JSON report; orjson when installed, else stream via json.dump."""
+    _RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    data = _to_json(report)
+    if _ORJSON_AVAILABLE:
+        _RESULTS_PATH.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with _RESULTS_PATH.open("w") as f:
+            json.dump(data, f, indent=2)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Main
 # ─────────────────────────────────────────────────────────────────────────────
@@ -525,9 +608,27 @@ _WORKFLOWS: list[tuple[str, Callable]] = [
 ]
 
 
+async def _run_workflow(display_name: str, workflow_fn: Callable, browser: Browser) -> SiteResult:
+    """Run one workflow, timing it and converting unexpected errors into a skipped site."""
+    print(f"\n  Running: {display_name} …")
+    t0 = time.monotonic()
+    try:
+        site_result = await workflow_fn(browser)
+    except Exception as exc:
+        site_result = SiteResult(
+            site_name=display_name, url="", skipped=True, skip_reason=str(exc)
+        )
+    elapsed = (time.monotonic() - t0) * 1000
+    status = "SKIPPED" if site_result.skipped else f"{len(site_result.steps)} steps"
+    print(f"  Done    {display_name} ({status}, {elapsed:.0f} ms total)")
+    return site_result
+
+
 async def main() -> None:
     from datetime import datetime, timezone
 
+    from playwright.async_api import async_playwright
+
     report = BenchmarkReport(
         ran_at=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
     )
@@ -538,21 +639,18 @@ async def main() -> None:
             args=["--no-sandbox", "--disable-dev-shm-usage"],
         )
         try:
-            for display_name, workflow_fn in _WORKFLOWS:
-                print(f"\n  Running: {display_name} …")
-                t0 = time.monotonic()
-                site_result = await workflow_fn(browser)
-                elapsed = (time.monotonic() - t0) * 1000
-                status = "SKIPPED" if site_result.skipped else f"{len(site_result.steps)} steps"
-                print(f"  Done    ({status}, {elapsed:.0f} ms total)")
-                report.sites.append(site_result)
+            # Workflows are independent and I/O-bound — run them concurrently
+            # so navigation and network-idle waits overlap. The measured
+            # observe() calls take turns (see _observe_step).
+            report.sites.extend(await asyncio.gather(
+                *(_run_workflow(name, fn, browser) for name, fn in _WORKFLOWS)
+            ))
         finally:
             await browser.close()
 
     print_report(report)
 
-    _RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    _RESULTS_PATH.write_text(json.dumps(_to_json(report), indent=2))
+    _write_results(report)
     print(f"  Results saved → {_RESULTS_PATH}\n")
 
 
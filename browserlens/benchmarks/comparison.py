@@ -8,7 +8,7 @@ from browserlens.benchmarks.latency_tracker import LatencyTracker
 from browserlens.benchmarks.token_counter import TokenCounter
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemResult:
     """Benchmark result for one system across a full task."""
 
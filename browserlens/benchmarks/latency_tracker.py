@@ -8,14 +8,18 @@ from dataclasses import dataclass, field
 from typing import Generator
 
 
-@dataclass
+# Canonical pipeline order for summary output; other phases follow in first-seen order
+_PHASE_ORDER = ("router", "extraction", "diff", "format", "total")
+
+
+@dataclass(slots=True)
 class LatencyRecord:
     step: int
     phase: str  # "router", "extraction", "diff", "format", "total"
     ms: float
 
 
-@dataclass
+@dataclass(slots=True)
 class LatencyTracker:
     """Tracks per-phase latency and computes statistics."""
 
@@ -23,9 +27,9 @@ class LatencyTracker:
 
     @contextmanager
     def measure(self, step: int, phase: str) -> Generator[None, None, None]:
-        t0 = time.monotonic()
+        t0 = time.perf_counter_ns()
         yield
-        elapsed_ms = (time.monotonic() - t0) * 1000
+        elapsed_ms = (time.perf_counter_ns() - t0) / 1_000_000
         self.records.append(LatencyRecord(step=step, phase=phase, ms=elapsed_ms))
 
     def record(self, step: int, phase: str, ms: float) -> None:
@@ -41,14 +45,24 @@ class LatencyTracker:
         return sum(r.ms for r in recs) / len(recs)
 
     def summary(self) -> dict:
-        phases = {r.phase for r in self.records}
+        # Single pass: phase -> [sum_ms, max_ms, count]
+        agg: dict[str, list] = {}
+        for r in self.records:
+            slot = agg.setdefault(r.phase, [0.0, r.ms, 0])
+            slot[0] += r.ms
+            if r.ms > slot[1]:
+                slot[1] = r.ms
+            slot[2] += 1
         return {
             phase: {
-                "avg_ms": round(self.avg_ms(phase), 2),
-                "max_ms": round(max(r.ms for r in self.phase_records(phase)), 2),
-                "count": len(self.phase_records(phase)),
+                "avg_ms": round(agg[phase][0] / agg[phase][2], 2),
+                "max_ms": round(agg[phase][1], 2),
+                "count": agg[phase][2],
             }
-            for phase in sorted(phases)
+            for phase in (
+                *(p for p in _PHASE_ORDER if p in agg),
+                *(p for p in agg if p not in _PHASE_ORDER),
+            )
         }
 
     def reset(self) -> None:
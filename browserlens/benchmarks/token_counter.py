@@ -6,8 +6,11 @@ from dataclasses import dataclass, field
 
 from browserlens.formatter.token_budget import TokenBudget
 
+# TokenBudget only caches its last count; share one instance across every counter
+_SHARED_BUDGET = TokenBudget()
 
-@dataclass
+
+@dataclass(slots=True)
 class StepRecord:
     step: int
     url: str
@@ -16,41 +19,92 @@ class StepRecord:
     is_delta: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenCounter:
-    """Accumulates per-step token counts and computes summary statistics."""
+    """
+    Accumulates per-step token counts and computes summary statistics.
+
+    records only holds counted steps. Deferred steps (and any recorded after
+    them, to keep step order) wait internally until the next aggregate or
+    summary() tokenizes them in one batch and appends them to records.
+    """
 
     records: list[StepRecord] = field(default_factory=list)
-    _budget: TokenBudget = field(default_factory=TokenBudget, repr=False)
+    _budget: TokenBudget = field(default=_SHARED_BUDGET, repr=False)
+    # (step, url, representation, is_delta, text, tokens or None if deferred)
+    _pending: list[tuple[int, str, str, bool, str, int | None]] = field(
+        default_factory=list, init=False, repr=False
+    )
 
-    def record(self, step: int, url: str, text: str, representation: str, is_delta: bool) -> int:
+    def record(
+        self,
+        step: int,
+        url: str,
+        text: str,
+        representation: str,
+        is_delta: bool,
+        *,
+        defer: bool = False,
+    ) -> int | None:
+        """
+        Record one step's output.
+
+        With defer=True the text is buffered and tokenized later in a single
+        batch call; the return value is then None.
+        """
+        if defer:
+            self._pending.append((step, url, representation, is_delta, text, None))
+            return None
         tokens = self._budget.count(text)
-        self.records.append(StepRecord(
-            step=step,
-            url=url,
-            tokens=tokens,
-            representation=representation,
-            is_delta=is_delta,
-        ))
+        if self._pending:
+            self._pending.append((step, url, representation, is_delta, "", tokens))
+        else:
+            self.records.append(StepRecord(
+                step=step,
+                url=url,
+                tokens=tokens,
+                representation=representation,
+                is_delta=is_delta,
+            ))
         return tokens
 
+    def _materialize(self) -> None:
+        """Tokenize all deferred steps in one batch and move them into records."""
+        if not self._pending:
+            return
+        deferred = [text for *_, text, tokens in self._pending if tokens is None]
+        counts = iter(self._budget.count_batch(deferred))
+        for step, url, representation, is_delta, _, tokens in self._pending:
+            self.records.append(StepRecord(
+                step=step,
+                url=url,
+                tokens=next(counts) if tokens is None else tokens,
+                representation=representation,
+                is_delta=is_delta,
+            ))
+        self._pending.clear()
+
     @property
     def total_tokens(self) -> int:
+        self._materialize()
         return sum(r.tokens for r in self.records)
 
     @property
     def avg_tokens_per_step(self) -> float:
+        self._materialize()
         if not self.records:
             return 0.0
         return self.total_tokens / len(self.records)
 
     @property
     def max_tokens_per_step(self) -> int:
+        self._materialize()
         if not self.records:
             return 0
         return max(r.tokens for r in self.records)
 
     def summary(self) -> dict:
+        self._materialize()
         return {
             "total_steps": len(self.records),
             "total_tokens": self.total_tokens,
@@ -62,3 +116,4 @@ class TokenCounter:
 
     def reset(self) -> None:
         self.records.clear()
+        self._pending.clear()
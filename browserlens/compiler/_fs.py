@@ -0,0 +1,27 @@
+"""Low-level file writes shared by the compiler and the workflow cache."""
+
+from __future__ import annotations
+
+import os
+
+
+def write_bytes(path: str | os.PathLike, data: bytes) -> None:
+    """
+    Write data to path through a raw file descriptor.
+
+    Skips the BufferedWriter that open()/Path.write_text allocate for what
+    is always a single bulk write.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        write_fd(fd, data)
+    finally:
+        os.close(fd)
+
+
+def write_fd(fd: int, data: bytes) -> None:
+    """Write all of data to an open file descriptor."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
@@ -2,16 +2,51 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
 import shutil
+import tempfile
 from pathlib import Path
+from types import ModuleType
+from typing import Iterable
 
+from browserlens.compiler._fs import write_bytes, write_fd
 from browserlens.compiler.types import CompiledWorkflow, ParameterSlot, make_fingerprint
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 _DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".browserlens_cache")
 
 
+def _loads(data: bytes):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file in one call, then rename it over path."""
+    # A unique temp name, so concurrent writers never share (and interleave into) one file
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        try:
+            os.fchmod(fd, 0o644)  # mkstemp creates 0600; match the other cache files
+            write_fd(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
 class WorkflowCache:
     """
     Filesystem cache for compiled Playwright workflow scripts.
@@ -24,9 +59,34 @@ class WorkflowCache:
             {wf_id}.json          # CompiledWorkflow metadata (no source_trace)
     """
 
-    def __init__(self, cache_dir: str | None = None) -> None:
+    def __init__(self, cache_dir: str | None = None, *, pretty: bool = False) -> None:
         self._dir = Path(cache_dir or _DEFAULT_CACHE_DIR)
+        self._pretty = pretty  # indent JSON files for human inspection
         self._dir.mkdir(parents=True, exist_ok=True)
+        # Parsed index.json, reused until the file's (mtime_ns, size) changes
+        self._index_cache: dict | None = None
+        self._index_stat: tuple[int, int] | None = None
+        self._index_hash: int | None = None  # hash of index.json's bytes as last written or read
+        # task_fingerprint -> [workflow_id, ...], derived from the index dict it was built from
+        self._fp_index_cache: dict[str, list[str]] = {}
+        self._fp_index_src: dict | None = None
+        # Batched index writes (see __enter__): depth of nested `with` blocks and
+        # the in-memory index awaiting a single flush on exit
+        self._defer_depth = 0
+        self._pending_index: dict | None = None
+        # workflow_id -> ((st_mtime_ns, st_size) of the script, already-loaded module)
+        self._live_modules: dict[str, tuple[tuple[int, int], ModuleType]] = {}
+
+    def __enter__(self) -> WorkflowCache:
+        """Defer index.json writes until the outermost `with` block exits."""
+        self._defer_depth += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._defer_depth -= 1
+        if self._defer_depth == 0 and self._pending_index is not None:
+            pending, self._pending_index = self._pending_index, None
+            self._save_index(pending)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -37,15 +97,67 @@ class WorkflowCache:
         return self._dir / "index.json"
 
     def _load_index(self) -> dict:
+        if self._pending_index is not None:
+            return self._pending_index
+        try:
+            st = os.stat(self._index_path)
+        except FileNotFoundError:
+            self._index_cache = self._index_stat = self._index_hash = None
+            return {}
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if self._index_cache is not None and stat_key == self._index_stat:
+            return self._index_cache
         try:
-            with open(self._index_path, encoding="utf-8") as f:
-                return json.load(f)
+            data = self._index_path.read_bytes()
+            index = _loads(data)
         except (FileNotFoundError, json.JSONDecodeError):
+            self._index_hash = None
             return {}
+        self._index_cache, self._index_stat = index, stat_key
+        # Another writer may have replaced the file, so the hash of what we
+        # last wrote no longer describes it
+        self._index_hash = hash(data)
+        return index
 
     def _save_index(self, index: dict) -> None:
-        with open(self._index_path, "w", encoding="utf-8") as f:
-            json.dump(index, f, indent=2)
+        if self._defer_depth:
+            self._pending_index = index
+            self._fp_index_src = None
+            return
+        data = self._encode(index)
+        data_hash = hash(data)
+        self._fp_index_src = None  # index may have been mutated in place
+        if data_hash == self._index_hash and self._index_stat is not None:
+            # Skip the rewrite only if index.json is still the file we last wrote
+            try:
+                st = os.stat(self._index_path)
+            except FileNotFoundError:
+                st = None
+            if st is not None and (st.st_mtime_ns, st.st_size) == self._index_stat:
+                self._index_cache = index
+                return
+        _atomic_write_bytes(self._index_path, data)
+        st = os.stat(self._index_path)
+        self._index_cache, self._index_stat = index, (st.st_mtime_ns, st.st_size)
+        self._index_hash = data_hash
+
+    def _fp_index(self, index: dict) -> dict[str, list[str]]:
+        """Map task_fingerprint -> workflow IDs in index order, rebuilt when the index changes."""
+        if self._fp_index_src is not index:
+            fp_index: dict[str, list[str]] = {}
+            for wf_id, entry in index.items():
+                fp_index.setdefault(entry.get("task_fingerprint"), []).append(wf_id)
+            self._fp_index_cache, self._fp_index_src = fp_index, index
+        return self._fp_index_cache
+
+    def _encode(self, obj: dict) -> bytes:
+        if _ORJSON_AVAILABLE:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if self._pretty else 0)
+        if self._pretty:
+            text = json.dumps(obj, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+        return text.encode("utf-8")
 
     def _metadata_path(self, workflow_id: str) -> Path:
         return self._dir / f"{workflow_id}.json"
@@ -100,19 +212,32 @@ class WorkflowCache:
     # Public API
     # ------------------------------------------------------------------
 
-    def save(self, metadata: CompiledWorkflow, script_source: str) -> CompiledWorkflow:
+    def save(
+        self,
+        metadata: CompiledWorkflow,
+        script_source: str,
+        *,
+        precompiled_module: ModuleType | None = None,
+    ) -> CompiledWorkflow:
         """
         Persist a compiled workflow to disk.
 
         Copies the script to the cache directory (if not already there),
         writes metadata JSON, and updates the index.
+        If the caller already holds the executed script as a module, pass it
+        as precompiled_module so the first execution doesn't reload it.
         Returns an updated CompiledWorkflow with the canonical script_path.
         """
         wf_id = metadata.workflow_id
         dest_script = self._script_path(wf_id)
 
         # Write script
-        dest_script.write_text(script_source, encoding="utf-8")
+        write_bytes(dest_script, script_source.encode("utf-8"))
+        if precompiled_module is not None:
+            st = os.stat(dest_script)
+            self._live_modules[wf_id] = ((st.st_mtime_ns, st.st_size), precompiled_module)
+        else:
+            self._live_modules.pop(wf_id, None)
 
         # Update metadata to point at canonical location
         updated = CompiledWorkflow(
@@ -129,9 +254,7 @@ class WorkflowCache:
 
         # Write metadata JSON (without source_trace)
         meta_dict = self._workflow_to_dict(updated)
-        self._metadata_path(wf_id).write_text(
-            json.dumps(meta_dict, indent=2), encoding="utf-8"
-        )
+        _atomic_write_bytes(self._metadata_path(wf_id), self._encode(meta_dict))
 
         # Update index
         index = self._load_index()
@@ -147,6 +270,13 @@ class WorkflowCache:
 
         return updated
 
+    def save_many(
+        self, workflows: Iterable[tuple[CompiledWorkflow, str]]
+    ) -> list[CompiledWorkflow]:
+        """Save several (metadata, script_source) pairs, rewriting index.json once."""
+        with self:
+            return [self.save(metadata, source) for metadata, source in workflows]
+
     def lookup_by_task(
         self, task_description: str, site_domain: str | None = None
     ) -> CompiledWorkflow | None:
@@ -157,10 +287,8 @@ class WorkflowCache:
         """
         target_fp = make_fingerprint(task_description)
         index = self._load_index()
-        for wf_id, entry in index.items():
-            if entry.get("task_fingerprint") != target_fp:
-                continue
-            if site_domain is not None and entry.get("site_domain") != site_domain:
+        for wf_id in self._fp_index(index).get(target_fp, ()):
+            if site_domain is not None and index[wf_id].get("site_domain") != site_domain:
                 continue
             return self.load(wf_id)
         return None
@@ -171,28 +299,52 @@ class WorkflowCache:
         if not meta_path.exists():
             return None
         try:
-            d = json.loads(meta_path.read_text(encoding="utf-8"))
+            d = _loads(meta_path.read_bytes())
         except (json.JSONDecodeError, OSError):
             return None
         return self._dict_to_workflow(d)
 
+    def live_module(self, workflow_id: str, stat_key: tuple[int, int]) -> ModuleType | None:
+        """Return the module handed to save() if the script on disk is still that version."""
+        entry = self._live_modules.get(workflow_id)
+        if entry is None or entry[0] != stat_key:
+            return None
+        return entry[1]
+
     def delete(self, workflow_id: str) -> bool:
         """Delete a workflow from the cache. Returns True if it existed."""
         index = self._load_index()
         if workflow_id not in index:
             return False
 
-        # Remove files
-        for path in (self._script_path(workflow_id), self._metadata_path(workflow_id)):
-            try:
-                path.unlink()
-            except FileNotFoundError:
-                pass
-
+        self._remove_files(workflow_id)
         del index[workflow_id]
+        self._live_modules.pop(workflow_id, None)
         self._save_index(index)
         return True
 
+    def delete_many(self, workflow_ids: Iterable[str]) -> int:
+        """Delete several workflows with a single index write. Returns how many existed."""
+        index = self._load_index()
+        removed = 0
+        for wf_id in workflow_ids:
+            if wf_id not in index:
+                continue
+            self._remove_files(wf_id)
+            del index[wf_id]
+            self._live_modules.pop(wf_id, None)
+            removed += 1
+        if removed:
+            self._save_index(index)
+        return removed
+
+    def _remove_files(self, workflow_id: str) -> None:
+        for path in (self._script_path(workflow_id), self._metadata_path(workflow_id)):
+            try:
+                os.unlink(path)
+            except (FileNotFoundError, IsADirectoryError):
+                pass
+
     def export(self, workflow_id: str, dest_path: str) -> str:
         """
         Copy the compiled script to dest_path.
@@ -200,9 +352,12 @@ class WorkflowCache:
         Returns the absolute destination path.
         """
         src = self._script_path(workflow_id)
-        if not src.exists():
-            raise FileNotFoundError(f"Workflow {workflow_id!r} not found in cache")
-        shutil.copy2(src, dest_path)
+        try:
+            shutil.copy2(src, dest_path)
+        except FileNotFoundError:
+            if src.exists():
+                raise  # destination directory is missing, not the workflow
+            raise FileNotFoundError(f"Workflow {workflow_id!r} not found in cache") from None
         return str(os.path.abspath(dest_path))
 
     def list_workflows(self) -> list[dict]:
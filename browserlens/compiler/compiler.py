@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import datetime
+import json
 import os
+import string
 import tempfile
 import uuid
 from typing import Sequence
 
+from browserlens.compiler._fs import write_bytes
 from browserlens.compiler.types import (
     ActionType,
     CompiledWorkflow,
@@ -19,6 +22,8 @@ from browserlens.compiler.types import (
     make_fingerprint,
 )
 
+_UTC = datetime.timezone.utc
+
 # Fixed priority order used in the generated find_element() helper
 _FIND_PRIORITY = [
     SelectorStrategy.TEST_ID,
@@ -69,95 +74,161 @@ async def find_element(page, selectors, timeout=5000):
 '''
 
 
-def _selectors_repr(target: ElementTarget) -> str:
-    """Render selector dict as a Python literal (safe for ast.literal_eval)."""
-    lines = ["{"]
-    for strategy in _FIND_PRIORITY:
-        if strategy in target.selectors:
-            val = target.selectors[strategy]
-            # escape backslashes and quotes
-            escaped = val.replace("\\", "\\\\").replace('"', '\\"')
-            lines.append(f'    "{strategy.value}": "{escaped}",')
-    lines.append("}")
-    return "\n".join(lines)
-
-
-def _action_call(step: TraceStep, slot_name: str | None) -> str:
-    """Return the Playwright action call string for a step."""
-    action = step.action
-    value = step.value
+# The whole generated module; compile() fills it with a single substitute() call.
+# $step_functions carries its own trailing blank lines (empty for an empty trace).
+_SCRIPT_TEMPLATE = string.Template('''\
+"""
+workflow_id: $workflow_id
+task: $task
+site: $site
+steps: $step_count
+compiled_at: $compiled_at
+"""
 
-    if action == ActionType.NAVIGATE:
-        url = value or step.url_before
-        return f'    await page.goto("{url}")'
 
-    if action == ActionType.WAIT:
-        ms = int(value or "1000")
-        return f"    await page.wait_for_timeout({ms})"
+from __future__ import annotations
 
-    # Target-based actions
-    el_call = "    el = await find_element(page, _selectors)"
+import argparse
+import asyncio
+import sys
 
-    if action == ActionType.CLICK:
-        return f"{el_call}\n    await el.click()"
+from playwright.async_api import async_playwright
 
-    if action == ActionType.HOVER:
-        return f"{el_call}\n    await el.hover()"
 
-    if action == ActionType.SCROLL:
-        return f"{el_call}\n    await el.scroll_into_view_if_needed()"
+$steps_list
 
-    if action == ActionType.TYPE:
-        if slot_name is not None:
-            val_expr = f'params.get("{slot_name}", "{value or ""}")'
-        else:
-            escaped = (value or "").replace("\\", "\\\\").replace('"', '\\"')
-            val_expr = f'"{escaped}"'
-        return f"{el_call}\n    await el.fill({val_expr})"
+$selectors_by_step
 
-    if action == ActionType.SELECT:
-        if slot_name is not None:
-            val_expr = f'params.get("{slot_name}", "{value or ""}")'
-        else:
-            escaped = (value or "").replace("\\", "\\\\").replace('"', '\\"')
-            val_expr = f'"{escaped}"'
-        return f"{el_call}\n    await el.select_option({val_expr})"
 
-    if action == ActionType.PRESS:
-        escaped = (value or "").replace("\\", "\\\\").replace('"', '\\"')
-        return f"{el_call}\n    await el.press(\"{escaped}\")"
+''' + _FIND_ELEMENT_SOURCE.replace("$", "$$") + '''
+
+
+${step_functions}async def run_workflow(page=None$slot_params):
+    """Run the compiled workflow. If page is None, creates its own browser."""
+    params = {}
+${param_lines}    _own_browser = page is None
+    _playwright = None
+    _browser = None
+    try:
+        if _own_browser:
+            _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch()
+            page = await _browser.new_page()
+$step_calls
+    finally:
+        if _own_browser and _browser:
+            await _browser.close()
+        if _own_browser and _playwright:
+            await _playwright.stop()
+
 
-    return f"    # unhandled action: {action.value}"
+$main_block
+''')
+
+
+def _py_str(value: str) -> str:
+    """Render a string as a Python literal — JSON string syntax is a subset of Python's."""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _ordered_selectors(target: ElementTarget) -> dict[str, str]:
+    """Selector strategies of target keyed by name, in find_element priority order."""
+    # One dict probe per strategy: str-Enum keys hash through a Python-level __hash__
+    selectors = target.selectors
+    return {
+        strategy.value: val
+        for strategy in _FIND_PRIORITY
+        if (val := selectors.get(strategy)) is not None
+    }
+
+
+def _selectors_repr(target: ElementTarget) -> str:
+    """Render selector dict as a Python literal (safe for ast.literal_eval)."""
+    return json.dumps(_ordered_selectors(target), indent=4, ensure_ascii=False)
+
+
+_EL_CALL = "    el = await find_element(page, _selectors)\n"
+
+# Body of the generated step_N function per action; {val_expr} is the value argument
+_ACTION_BODIES: dict[ActionType, str] = {
+    ActionType.NAVIGATE: "    await page.goto({val_expr})",
+    ActionType.WAIT: "    await page.wait_for_timeout({val_expr})",
+    ActionType.CLICK: _EL_CALL + "    await el.click()",
+    ActionType.HOVER: _EL_CALL + "    await el.hover()",
+    ActionType.SCROLL: _EL_CALL + "    await el.scroll_into_view_if_needed()",
+    ActionType.TYPE: _EL_CALL + "    await el.fill({val_expr})",
+    ActionType.SELECT: _EL_CALL + "    await el.select_option({val_expr})",
+    ActionType.PRESS: _EL_CALL + "    await el.press({val_expr})",
+}
+# Whole step_N function per action, so each step is a single str.format call.
+# selectors_line is the _selectors assignment, or "" when the step has no target.
+_STEP_TEMPLATES: dict[ActionType, str] = {
+    action: "async def step_{index}(page, **params):\n{selectors_line}" + body
+    for action, body in _ACTION_BODIES.items()
+}
+
+
+def _value_expr(step: TraceStep, slot_name: str | None) -> str:
+    """Python expression for the step's value argument ("" when the action takes none)."""
+    action = step.action
+    value = step.value
+    if action == ActionType.NAVIGATE:
+        return _py_str(value or step.url_before)
+    if action == ActionType.WAIT:
+        return str(int(value or "1000"))
+    if action in (ActionType.TYPE, ActionType.SELECT):
+        if slot_name is not None:
+            return f"params.get({_py_str(slot_name)}, {_py_str(value or '')})"
+        return _py_str(value or "")
+    if action == ActionType.PRESS:
+        return _py_str(value or "")
+    return ""
 
 
 def _step_function(step: TraceStep, slot_name: str | None) -> str:
     """Generate the async step_N function source."""
-    lines: list[str] = [f"async def step_{step.step_index}(page, **params):"]
-
+    selectors_line = ""
     if step.target is not None:
-        sel_repr = _selectors_repr(step.target)
-        lines.append(f"    _selectors = {sel_repr}")
-
-    action_src = _action_call(step, slot_name)
-    lines.append(action_src)
-    return "\n".join(lines)
+        selectors_line = f"    _selectors = {_selectors_repr(step.target)}\n"
+    template = _STEP_TEMPLATES.get(step.action)
+    if template is None:
+        return (
+            f"async def step_{step.step_index}(page, **params):\n{selectors_line}"
+            f"    # unhandled action: {step.action.value}"
+        )
+    return template.format(
+        index=step.step_index,
+        selectors_line=selectors_line,
+        val_expr=_value_expr(step, slot_name),
+    )
 
 
 def _steps_list(steps: list[TraceStep]) -> str:
-    """Render module-level STEPS list as Python literal."""
-    entries: list[str] = []
-    for step in steps:
-        target_info = "None"
-        if step.target is not None:
-            role = step.target.role.replace('"', '\\"')
-            name = step.target.name.replace('"', '\\"')
-            target_info = f'{{"role": "{role}", "name": "{name}"}}'
-        url_before = step.url_before.replace('"', '\\"')
-        entries.append(
-            f'    {{"index": {step.step_index}, "action": "{step.action.value}", '
-            f'"target": {target_info}, "url_before": "{url_before}"}},'
-        )
-    return "STEPS = [\n" + "\n".join(entries) + "\n]"
+    """Render module-level STEPS list as Python literal (one repr'd dict per line)."""
+    entries = [
+        {
+            "index": step.step_index,
+            "action": step.action.value,
+            "target": (
+                {"role": step.target.role, "name": step.target.name}
+                if step.target is not None
+                else None
+            ),
+            "url_before": step.url_before,
+        }
+        for step in steps
+    ]
+    return "STEPS = [\n" + "".join(f"    {entry!r},\n" for entry in entries) + "]"
+
+
+def _selectors_by_step(steps: list[TraceStep]) -> str:
+    """Render the _SELECTORS_BY_STEP table the healer reads instead of parsing step source."""
+    entries = "".join(
+        f"    {step.step_index}: {_ordered_selectors(step.target)!r},\n"
+        for step in steps
+        if step.target is not None
+    )
+    return "_SELECTORS_BY_STEP = {\n" + entries + "}"
 
 
 class WorkflowCompiler:
@@ -180,7 +251,7 @@ class WorkflowCompiler:
             workflow_id = uuid.uuid4().hex[:12]
 
         slots = list(parameter_slots or [])
-        now = datetime.datetime.utcnow().isoformat()
+        now = datetime.datetime.now(_UTC).isoformat()
         fingerprint = make_fingerprint(trace.task_description)
 
         # Map each TYPE/SELECT step index to its parameter slot name
@@ -199,117 +270,49 @@ class WorkflowCompiler:
             elif i < len(type_step_indices):
                 step_slot_map[type_step_indices[i]] = slot.name
 
-        # Build script source
-        parts: list[str] = []
-
-        # 1. Docstring
-        task_escaped = trace.task_description.replace('"""', "'''")
-        parts.append(
-            f'"""\n'
-            f"workflow_id: {workflow_id}\n"
-            f"task: {task_escaped}\n"
-            f"site: {trace.site_domain}\n"
-            f"steps: {len(trace.steps)}\n"
-            f"compiled_at: {now}\n"
-            f'"""'
-        )
-
-        # 2. Imports
-        parts.append(
-            "from __future__ import annotations\n\n"
-            "import argparse\n"
-            "import asyncio\n"
-            "import sys\n\n"
-            "from playwright.async_api import async_playwright"
-        )
-
-        # 3. STEPS list
-        parts.append(_steps_list(trace.steps))
-
-        # 4. find_element helper
-        parts.append(_FIND_ELEMENT_SOURCE)
-
-        # 5. Individual step functions
-        for step in trace.steps:
-            slot_name = step_slot_map.get(step.step_index)
-            parts.append(_step_function(step, slot_name))
-
-        # 6. run_workflow function
-        slot_params = ""
-        if slots:
-            slot_params = ", " + ", ".join(
-                f'{s.name}="{s.default_value or ""}"' for s in slots
-            )
-        parts.append(
-            f"async def run_workflow(page=None{slot_params}):\n"
-            f"    \"\"\"Run the compiled workflow. If page is None, creates its own browser.\"\"\"\n"
-            f"    params = {{}}\n"
-        )
-        # Populate params dict from slot args
-        run_lines: list[str] = []
-        for slot in slots:
-            run_lines.append(f'    params["{slot.name}"] = {slot.name}')
-
-        # Navigate to initial URL if first step is navigate, else go to url_before of step 0
-        if trace.steps:
-            first_url = trace.steps[0].url_before
-            first_url_escaped = first_url.replace('"', '\\"')
-        else:
-            first_url_escaped = ""
-
-        run_lines.append("    _own_browser = page is None")
-        run_lines.append("    _playwright = None")
-        run_lines.append("    _browser = None")
-        run_lines.append("    try:")
-        run_lines.append("        if _own_browser:")
-        run_lines.append("            _playwright = await async_playwright().start()")
-        run_lines.append("            _browser = await _playwright.chromium.launch()")
-        run_lines.append(
-            "            page = await _browser.new_page()"
-        )
-        step_calls = "\n".join(
-            f"        await step_{s.step_index}(page, **params)" for s in trace.steps
-        )
-        run_lines.append(step_calls)
-        run_lines.append("    finally:")
-        run_lines.append("        if _own_browser and _browser:")
-        run_lines.append("            await _browser.close()")
-        run_lines.append("        if _own_browser and _playwright:")
-        run_lines.append("            await _playwright.stop()")
-
-        # Append run lines to the run_workflow block
-        run_func = parts.pop()  # Get the function header we added
-        parts.append(run_func + "\n".join(run_lines))
-
-        # 7. __main__ block
+        # __main__ block
         main_lines: list[str] = [
             'if __name__ == "__main__":',
             "    parser = argparse.ArgumentParser()",
         ]
         for slot in slots:
-            default_escaped = (slot.default_value or "").replace('"', '\\"')
             main_lines.append(
-                f'    parser.add_argument("--{slot.name}", default="{default_escaped}")'
+                f'    parser.add_argument("--{slot.name}", '
+                f"default={_py_str(slot.default_value or '')})"
             )
         main_lines.append("    args = parser.parse_args()")
-        if slots:
-            slot_kwargs = ", ".join(f"{s.name}=args.{s.name}" for s in slots)
-            main_lines.append(
-                f"    asyncio.run(run_workflow({slot_kwargs}))"
-            )
-        else:
-            main_lines.append("    asyncio.run(run_workflow())")
-        parts.append("\n".join(main_lines))
+        slot_kwargs = ", ".join(f"{s.name}=args.{s.name}" for s in slots)
+        main_lines.append(f"    asyncio.run(run_workflow({slot_kwargs}))")
 
-        script_source = "\n\n\n".join(parts) + "\n"
+        script_source = _SCRIPT_TEMPLATE.substitute(
+            workflow_id=workflow_id,
+            task=trace.task_description.replace('"""', "'''"),
+            site=trace.site_domain,
+            step_count=len(trace.steps),
+            compiled_at=now,
+            steps_list=_steps_list(trace.steps),
+            selectors_by_step=_selectors_by_step(trace.steps),
+            step_functions="".join(
+                _step_function(step, step_slot_map.get(step.step_index)) + "\n\n\n"
+                for step in trace.steps
+            ),
+            slot_params="".join(
+                f", {s.name}={_py_str(s.default_value or '')}" for s in slots
+            ),
+            param_lines="".join(f'    params["{s.name}"] = {s.name}\n' for s in slots),
+            step_calls="\n".join(
+                f"        await step_{s.step_index}(page, **params)" for s in trace.steps
+            ),
+            main_block="\n".join(main_lines),
+        )
 
         # Write to file
         if output_dir is None:
             output_dir = tempfile.mkdtemp(prefix="browserlens_")
-        os.makedirs(output_dir, exist_ok=True)
+        else:
+            os.makedirs(output_dir, exist_ok=True)
         script_path = os.path.join(output_dir, f"{workflow_id}.py")
-        with open(script_path, "w", encoding="utf-8") as f:
-            f.write(script_source)
+        write_bytes(script_path, script_source.encode("utf-8"))
 
         metadata = CompiledWorkflow(
             workflow_id=workflow_id,
@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import sys
-import time
-from typing import Any, Callable
-
-from playwright.async_api import Page
+from time import perf_counter_ns
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable
 
 from browserlens.compiler.cache import WorkflowCache
 from browserlens.compiler.types import ExecutionResult, StepResult
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+# (STEPS entry, step index, action, step_N function or None)
+_BoundStep = tuple[dict, int, str, Callable | None]
+
 
 class WorkflowExecutor:
     """Executes a compiled workflow script against a live Playwright page."""
@@ -23,6 +29,12 @@ class WorkflowExecutor:
     ) -> None:
         self._cache = cache
         self._healer = healer
+        # script_path -> ((st_mtime_ns, st_size), loaded module, its bound STEPS).
+        # The steps are kept here rather than on the module, which may be a
+        # caller-owned precompiled module.
+        self._module_cache: dict[
+            str, tuple[tuple[int, int], ModuleType, list[_BoundStep]]
+        ] = {}
 
     async def execute(
         self,
@@ -61,8 +73,8 @@ class WorkflowExecutor:
                 error=f"Workflow {workflow_id!r} not found in cache",
             )
 
-        module = self._load_module(metadata.script_path, workflow_id)
-        if module is None:
+        loaded = self._load_module(metadata.script_path, workflow_id)
+        if loaded is None:
             return ExecutionResult(
                 workflow_id=workflow_id,
                 success=False,
@@ -71,33 +83,29 @@ class WorkflowExecutor:
                 error=f"Failed to load module from {metadata.script_path!r}",
             )
 
-        steps_list = getattr(module, "STEPS", [])
+        module, steps = loaded
+
         step_results: list[StepResult] = []
-        total_start = time.monotonic()
+        total_start = perf_counter_ns()
         overall_success = True
 
-        for step_meta in steps_list:
-            step_index = step_meta["index"]
-            action_name = step_meta["action"]
-            step_fn_name = f"step_{step_index}"
-            step_fn = getattr(module, step_fn_name, None)
-
+        for step_meta, step_index, action_name, step_fn in steps:
             if step_fn is None:
                 step_results.append(
                     StepResult(
                         step_index=step_index,
                         success=False,
                         action=action_name,
-                        error=f"Step function {step_fn_name!r} not found in module",
+                        error=f"Step function 'step_{step_index}' not found in module",
                     )
                 )
                 overall_success = False
                 break
 
-            step_start = time.monotonic()
+            step_start = perf_counter_ns()
             try:
                 await step_fn(page, **params)
-                latency = (time.monotonic() - step_start) * 1000
+                latency = (perf_counter_ns() - step_start) / 1_000_000
                 step_results.append(
                     StepResult(
                         step_index=step_index,
@@ -115,7 +123,7 @@ class WorkflowExecutor:
                     original_error=exc,
                     llm_caller=llm_caller,
                 )
-                latency = (time.monotonic() - step_start) * 1000
+                latency = (perf_counter_ns() - step_start) / 1_000_000
                 if healed:
                     step_results.append(
                         StepResult(
@@ -142,7 +150,7 @@ class WorkflowExecutor:
                     break
 
         succeeded = sum(1 for r in step_results if r.success)
-        total_latency = (time.monotonic() - total_start) * 1000
+        total_latency = (perf_counter_ns() - total_start) / 1_000_000
 
         return ExecutionResult(
             workflow_id=workflow_id,
@@ -153,19 +161,43 @@ class WorkflowExecutor:
             total_latency_ms=total_latency,
         )
 
-    @staticmethod
-    def _load_module(script_path: str, workflow_id: str):
-        """Load a compiled workflow module, evicting any stale cached copy."""
-        module_name = f"_browserlens_workflow_{workflow_id}"
-        # Hot-reload: remove stale entry before loading
-        sys.modules.pop(module_name, None)
+    def _load_module(
+        self, script_path: str, workflow_id: str
+    ) -> tuple[ModuleType, list[_BoundStep]] | None:
+        """
+        Load a compiled workflow module and bind its STEPS to step functions.
 
-        spec = importlib.util.spec_from_file_location(module_name, script_path)
-        if spec is None or spec.loader is None:
-            return None
-        module = importlib.util.module_from_spec(spec)
+        The loaded module is reused until the script file changes on disk
+        (by mtime/size), so repeated runs skip re-executing the source.
+        """
         try:
-            spec.loader.exec_module(module)  # type: ignore[union-attr]
-        except Exception:
+            st = os.stat(script_path)
+        except OSError:
             return None
-        return module
+        stat_key = (st.st_mtime_ns, st.st_size)
+        hit = self._module_cache.get(script_path)
+        if hit is not None and hit[0] == stat_key:
+            return hit[1], hit[2]
+
+        # A module handed over at save() time skips the first reload entirely
+        module = self._cache.live_module(workflow_id, stat_key)
+        if module is None:
+            module_name = f"_browserlens_workflow_{workflow_id}"
+            # Hot-reload: remove stale entry before loading
+            sys.modules.pop(module_name, None)
+
+            spec = importlib.util.spec_from_file_location(module_name, script_path)
+            if spec is None or spec.loader is None:
+                return None
+            module = importlib.util.module_from_spec(spec)
+            try:
+                spec.loader.exec_module(module)  # type: ignore[union-attr]
+            except Exception:
+                return None
+        # Resolve each STEPS entry to its step_N function once per load
+        steps = [
+            (meta, meta["index"], meta["action"], getattr(module, f"step_{meta['index']}", None))
+            for meta in getattr(module, "STEPS", [])
+        ]
+        self._module_cache[script_path] = (stat_key, module, steps)
+        return module, steps
@@ -3,20 +3,29 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 import inspect
+import weakref
 from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from playwright.async_api import Page
 
+# step function -> _selectors parsed from its source. Keyed weakly on the
+# function itself, so a reloaded workflow module never sees stale entries.
+_SELECTORS_CACHE: "weakref.WeakKeyDictionary[Any, dict]" = weakref.WeakKeyDictionary()
+
 
 class WorkflowHealer:
     """
     Attempts to recover a failed step using three escalating levels.
 
     Level 1 (no I/O)
-        Re-parses ``_selectors`` from the step function source and retries
-        each selector strategy individually until one succeeds.
+        Reads the step's selectors from the module's ``_SELECTORS_BY_STEP``
+        table (falling back to parsing ``_selectors`` from the step function
+        source for older scripts), probes each selector strategy individually
+        and concurrently, and re-runs the step once any of them succeeds,
+        moving on to the next successful strategy if the re-run fails.
 
     Level 2 (re-analyze via lens)
         Calls ``lens.observe(page)`` and searches the live accessibility tree
@@ -54,17 +63,17 @@ class WorkflowHealer:
         role = (target or {}).get("role", "") if target else ""
         name = (target or {}).get("name", "") if target else ""
         step_fn_name = f"step_{step_index}"
+        # Resolved once per heal; every level re-runs this same function
+        step_fn = getattr(module, step_fn_name, None)
 
         # Level 1: selector re-try (no I/O)
-        healed = await self._heal_level1(page, module, step_fn_name, params)
+        healed = await self._heal_level1(page, module, step_index, step_fn, params)
         if healed:
             return True, 1
 
         # Level 2: re-observe via lens
         if self._lens is not None and role and name:
-            healed = await self._heal_level2(
-                page, module, step_fn_name, params, role, name
-            )
+            healed = await self._heal_level2(page, step_fn, params, role, name)
             if healed:
                 return True, 2
 
@@ -82,23 +91,19 @@ class WorkflowHealer:
         self,
         page: "Page",
         module: Any,
-        step_fn_name: str,
+        step_index: int,
+        step_fn: Callable | None,
         params: dict,
     ) -> bool:
         """
-        Level 1: parse _selectors from source, try each strategy individually.
+        Level 1: look up the step's selectors, try each strategy individually.
         """
-        step_fn = getattr(module, step_fn_name, None)
         if step_fn is None:
             return False
 
-        try:
-            source = inspect.getsource(step_fn)
-            tree = ast.parse(source)
-        except (OSError, SyntaxError, TypeError):
-            return False
-
-        selectors = _extract_selectors_from_ast(tree)
+        selectors = getattr(module, "_SELECTORS_BY_STEP", {}).get(step_index)
+        if selectors is None:
+            selectors = _selectors_for(step_fn)
         if not selectors:
             return False
 
@@ -106,23 +111,32 @@ class WorkflowHealer:
         if find_element is None:
             return False
 
-        # Try each strategy individually
-        for strategy, val in selectors.items():
-            try:
-                await find_element(page, {strategy: val}, timeout=3000)
-                # Strategy worked — re-run full step
-                step_fn = getattr(module, step_fn_name)
-                await step_fn(page, **params)
-                return True
-            except Exception:
-                continue
-        return False
+        # Probe every strategy individually and concurrently, so a missing
+        # element costs one timeout rather than one per strategy
+        probes = [
+            asyncio.ensure_future(find_element(page, {strategy: val}, timeout=3000))
+            for strategy, val in selectors.items()
+        ]
+        remaining = list(probes)
+        try:
+            while await _next_success(remaining):
+                # A strategy worked — re-run full step; if that still fails,
+                # fall through to the next strategy that matched
+                try:
+                    await step_fn(page, **params)
+                    return True
+                except Exception:
+                    continue
+            return False
+        finally:
+            for probe in probes:
+                probe.cancel()
+            await asyncio.gather(*probes, return_exceptions=True)
 
     async def _heal_level2(
         self,
         page: "Page",
-        module: Any,
-        step_fn_name: str,
+        step_fn: Callable | None,
         params: dict,
         role: str,
         name: str,
@@ -132,19 +146,13 @@ class WorkflowHealer:
 
         Side effect: increments lens._step and updates the differ state.
         """
+        if step_fn is None:
+            return False
         try:
             obs = await self._lens.observe(page)
-            flat = obs.page_state.flat_nodes()
-            found = any(
-                n.role == role and n.name == name
-                for n in flat
-            )
-            if not found:
+            if not obs.page_state.has_node(role, name):
                 return False
             # Element confirmed present — retry step
-            step_fn = getattr(module, step_fn_name, None)
-            if step_fn is None:
-                return False
             await step_fn(page, **params)
             return True
         except Exception:
@@ -184,7 +192,7 @@ class WorkflowHealer:
             if action == "click":
                 await loc.click()
             elif action == "type":
-                val = params.get(list(params.keys())[0], "") if params else ""
+                val = params[next(iter(params))] if params else ""
                 await loc.fill(str(val))
             elif action == "hover":
                 await loc.hover()
@@ -195,23 +203,63 @@ class WorkflowHealer:
             return False
 
 
+async def _next_success(remaining: list[asyncio.Future]) -> bool:
+    """
+    Wait until a task in remaining has completed without raising and remove
+    it; among several that have, the earliest in the list (highest priority)
+    goes first. Returns False once none can succeed.
+    """
+    while remaining:
+        for task in remaining:
+            # exception() also marks a failure as retrieved
+            if task.done() and not task.cancelled() and task.exception() is None:
+                remaining.remove(task)
+                return True
+        remaining[:] = [t for t in remaining if not t.done()]
+        if remaining:
+            await asyncio.wait(remaining, return_when=asyncio.FIRST_COMPLETED)
+    return False
+
+
+def _selectors_for(step_fn: Any) -> dict:
+    """Return the step function's _selectors literal, parsing its source at most once."""
+    try:
+        return _SELECTORS_CACHE[step_fn]
+    except (KeyError, TypeError):
+        pass
+    try:
+        selectors = _extract_selectors_from_ast(ast.parse(inspect.getsource(step_fn)))
+    except (OSError, SyntaxError, TypeError):
+        selectors = {}
+    try:
+        _SELECTORS_CACHE[step_fn] = selectors
+    except TypeError:
+        pass  # not weak-referenceable; just don't cache
+    return selectors
+
+
 def _extract_selectors_from_ast(tree: ast.AST) -> dict:
     """
     Extract _selectors dict literal from a step function AST.
 
-    Safe because the compiler only generates literal dicts.
+    The compiler always emits ``_selectors = {...}`` as a top-level statement
+    of the step function, so only the function body is scanned — no full
+    tree walk. Safe because the compiler only generates literal dicts.
     """
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Assign):
-            continue
-        targets = node.targets
-        if not targets:
+    fn = tree
+    if isinstance(tree, ast.Module):
+        fn = next(
+            (n for n in tree.body if isinstance(n, (ast.AsyncFunctionDef, ast.FunctionDef))),
+            tree,
+        )
+    for stmt in getattr(fn, "body", ()):
+        if not isinstance(stmt, ast.Assign):
             continue
-        target = targets[0]
+        target = stmt.targets[0]
         if not (isinstance(target, ast.Name) and target.id == "_selectors"):
             continue
         try:
-            return ast.literal_eval(node.value)
+            return ast.literal_eval(stmt.value)
         except (ValueError, TypeError):
             pass
     return {}
@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import datetime
-
-from playwright.async_api import Page
+from typing import TYPE_CHECKING, Any, Sequence
 
 from browserlens.compiler.selectors import SelectorGenerator
 from browserlens.compiler.types import (
@@ -14,15 +13,10 @@ from browserlens.compiler.types import (
     WorkflowTrace,
 )
 
-# Actions that operate on a target element
-_TARGET_ACTIONS = {
-    ActionType.CLICK,
-    ActionType.TYPE,
-    ActionType.SELECT,
-    ActionType.PRESS,
-    ActionType.HOVER,
-    ActionType.SCROLL,
-}
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+_UTC = datetime.timezone.utc
 
 
 class ActionRecorder:
@@ -61,21 +55,68 @@ class ActionRecorder:
         if not self._active:
             raise RuntimeError("ActionRecorder.start() must be called before record()")
 
-        url_before = page.url
+        url_before = self._url_before(page)
+
+        target: ElementTarget | None = None
+        if action.is_target:
+            target = await self._selector_gen.generate(
+                page, ref=ref, role=role, name=name, value=value or ""
+            )
+
+        return self._append(action, target, value, url_before)
 
-        # Extract domain from first step
+    async def record_many(
+        self,
+        page: Page,
+        actions: Sequence[dict[str, Any]],
+    ) -> list[TraceStep]:
+        """
+        Record several actions taken against the same page state.
+
+        Each entry holds the keyword arguments of record() plus "action".
+        Selectors for all target elements are generated in one page round
+        trip, so every element must still be in the DOM when this is called.
+        Raises RuntimeError if start() has not been called first.
+        """
+        if not self._active:
+            raise RuntimeError("ActionRecorder.start() must be called before record_many()")
+
+        url_before = self._url_before(page)
+
+        elements = [
+            (a.get("ref", ""), a.get("role", ""), a.get("name", ""), a.get("value") or "")
+            for a in actions
+            if a["action"].is_target
+        ]
+        targets = iter(await self._selector_gen.generate_many(page, elements))
+
+        return [
+            self._append(
+                a["action"],
+                next(targets) if a["action"].is_target else None,
+                a.get("value"),
+                url_before,
+            )
+            for a in actions
+        ]
+
+    def _url_before(self, page: Page) -> str:
+        """Return the page URL, taking the site domain from the first one seen."""
+        url_before = page.url
         if not self._site_domain and url_before:
             from urllib.parse import urlparse
 
             parsed = urlparse(url_before)
             self._site_domain = parsed.netloc or parsed.path
+        return url_before
 
-        target: ElementTarget | None = None
-        if action in _TARGET_ACTIONS:
-            target = await self._selector_gen.generate(
-                page, ref=ref, role=role, name=name, value=value or ""
-            )
-
+    def _append(
+        self,
+        action: ActionType,
+        target: ElementTarget | None,
+        value: str | None,
+        url_before: str,
+    ) -> TraceStep:
         step = TraceStep(
             step_index=len(self._steps),
             action=action,
@@ -108,7 +149,7 @@ class ActionRecorder:
             site_domain=self._site_domain,
             steps=list(self._steps),
             success=success,
-            recorded_at=datetime.datetime.utcnow().isoformat(),
+            recorded_at=datetime.datetime.now(_UTC).isoformat(),
         )
         self._task_description = None
         self._steps = []
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from playwright.async_api import Page
+import sys
+from typing import TYPE_CHECKING, Sequence
 
 from browserlens.compiler.types import ElementTarget, SelectorStrategy
+from browserlens.core.page_script import PageScript
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 # Priority order for selector strategies (most reliable first)
 _STRATEGY_PRIORITY: list[SelectorStrategy] = [
@@ -116,6 +121,35 @@ _JS_GENERATE_SELECTORS = """
         }
     }
 
+    // With both a test id and a label there are already two stable fallbacks
+    // besides role_name; skip the DOM walks for CSS and XPath
+    if (result.test_id && result.label) {
+        return result;
+    }
+
+    // Position among same-tag element siblings, shared by the CSS and XPath
+    // builders so each ancestor's siblings are walked at most once
+    const siblingInfo = new Map();
+    function positionOf(node) {
+        let info = siblingInfo.get(node);
+        if (info) return info;
+        let nth = 1;
+        let sib = node.previousElementSibling;
+        while (sib) {
+            if (sib.tagName === node.tagName) nth++;
+            sib = sib.previousElementSibling;
+        }
+        let hasSiblings = nth > 1;
+        sib = node.nextElementSibling;
+        while (sib && !hasSiblings) {
+            if (sib.tagName === node.tagName) hasSiblings = true;
+            sib = sib.nextElementSibling;
+        }
+        info = { nth, hasSiblings };
+        siblingInfo.set(node, info);
+        return info;
+    }
+
     // css selector
     let css = '';
     if (el.id) {
@@ -132,12 +166,7 @@ _JS_GENERATE_SELECTORS = """
                 part += '.' + classes.map(c => escapeCSS(c)).join('.');
             }
             // nth-of-type for disambiguation
-            let nth = 1;
-            let sib = node.previousElementSibling;
-            while (sib) {
-                if (sib.tagName === node.tagName) nth++;
-                sib = sib.previousElementSibling;
-            }
+            const nth = positionOf(node).nth;
             if (nth > 1) {
                 part += ':nth-of-type(' + nth + ')';
             }
@@ -157,26 +186,9 @@ _JS_GENERATE_SELECTORS = """
         const parts = [];
         let el = element;
         while (el && el.nodeType === Node.ELEMENT_NODE) {
-            let index = 0;
-            let hasSiblings = false;
-            let sib = el.previousSibling;
-            while (sib) {
-                if (sib.nodeType === Node.ELEMENT_NODE && sib.tagName === el.tagName) {
-                    index++;
-                    hasSiblings = true;
-                }
-                sib = sib.previousSibling;
-            }
-            sib = el.nextSibling;
-            while (sib) {
-                if (sib.nodeType === Node.ELEMENT_NODE && sib.tagName === el.tagName) {
-                    hasSiblings = true;
-                    break;
-                }
-                sib = sib.nextSibling;
-            }
+            const { nth, hasSiblings } = positionOf(el);
             const tag = el.tagName.toLowerCase();
-            parts.unshift(hasSiblings ? tag + '[' + (index + 1) + ']' : tag);
+            parts.unshift(hasSiblings ? tag + '[' + nth + ']' : tag);
             el = el.parentNode;
         }
         return '/' + parts.join('/');
@@ -188,6 +200,10 @@ _JS_GENERATE_SELECTORS = """
 """
 
 
+# Installed once per page; each generate() call only ships its arguments
+_GEN_SELECTORS = PageScript("__blGenSelectors", _JS_GENERATE_SELECTORS)
+
+
 class SelectorGenerator:
     """Generates robust CSS/ARIA selectors for a DOM element."""
 
@@ -204,42 +220,56 @@ class SelectorGenerator:
 
         Must be called while the element is still in the DOM.
         """
-        raw: dict = await page.evaluate(
-            _JS_GENERATE_SELECTORS,
-            {"role": role, "name": name, "value": value, "roleTagMap": _ROLE_TAG_MAP},
-        )
-
-        selectors: dict[SelectorStrategy, str] = {}
-
-        if raw.get("test_id"):
-            selectors[SelectorStrategy.TEST_ID] = raw["test_id"]
-
-        # ROLE_NAME is always synthesized from a11y data — no DOM query needed
-        if role and name:
-            selectors[SelectorStrategy.ROLE_NAME] = f"{role}::{name}"
-
-        if raw.get("label"):
-            selectors[SelectorStrategy.LABEL] = raw["label"]
-
-        if raw.get("placeholder"):
-            selectors[SelectorStrategy.PLACEHOLDER] = raw["placeholder"]
+        raw = await _GEN_SELECTORS.call(page, _js_args(role, name, value))
+        return _build_target(ref, role, name, raw or {})
 
-        if raw.get("text"):
-            selectors[SelectorStrategy.TEXT] = raw["text"]
-
-        if raw.get("css"):
-            selectors[SelectorStrategy.CSS] = raw["css"]
-
-        if raw.get("xpath"):
-            selectors[SelectorStrategy.XPATH] = raw["xpath"]
-
-        # Filter priority to only found strategies
-        selector_priority = [s for s in _STRATEGY_PRIORITY if s in selectors]
+    async def generate_many(
+        self,
+        page: Page,
+        elements: Sequence[tuple[str, str, str, str]],
+    ) -> list[ElementTarget]:
+        """
+        Generate selectors for several elements in one page round trip.
 
-        return ElementTarget(
-            ref=ref,
-            role=role,
-            name=name,
-            selectors=selectors,
-            selector_priority=selector_priority,
+        elements are (ref, role, name, value) tuples; all must be in the DOM.
+        """
+        if not elements:
+            return []
+        raw_list = await _GEN_SELECTORS.call_many(
+            page, [_js_args(role, name, value) for _, role, name, value in elements]
         )
+        raw_list = raw_list or [{}] * len(elements)
+        return [
+            _build_target(ref, role, name, raw or {})
+            for (ref, role, name, _), raw in zip(elements, raw_list)
+        ]
+
+
+def _js_args(role: str, name: str, value: str) -> dict:
+    return {"role": role, "name": name, "value": value, "roleTagMap": _ROLE_TAG_MAP}
+
+
+def _build_target(ref: str, role: str, name: str, raw: dict) -> ElementTarget:
+    """Turn the generator script's raw result into an ElementTarget."""
+    # Interned so role/name comparisons against a11y nodes can short-circuit on identity
+    role = sys.intern(role)
+    name = sys.intern(name)
+    # Inserted in priority order, so the priority list is just the keys.
+    # The script's raw field names are the strategy values; ROLE_NAME is
+    # always synthesized from a11y data — no DOM query needed.
+    selectors: dict[SelectorStrategy, str] = {}
+    for strategy in _STRATEGY_PRIORITY:
+        if strategy is SelectorStrategy.ROLE_NAME:
+            if role and name:
+                selectors[strategy] = f"{role}::{name}"
+        elif val := raw.get(strategy.value):
+            selectors[strategy] = val
+    selector_priority = list(selectors)
+
+    return ElementTarget(
+        ref=ref,
+        role=role,
+        name=name,
+        selectors=selectors,
+        selector_priority=selector_priority,
+    )
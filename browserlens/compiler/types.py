@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
-import re
 import string
 from dataclasses import dataclass, field
 from enum import Enum
@@ -19,6 +19,15 @@ class ActionType(str, Enum):
     NAVIGATE = "navigate"
     WAIT = "wait"
 
+    is_target: bool  # True for actions that operate on a target element (set below)
+
+
+# A plain attribute load is cheaper than set membership, which goes through
+# Enum's Python-level __hash__
+for _action in ActionType:
+    _action.is_target = _action not in (ActionType.NAVIGATE, ActionType.WAIT)
+del _action
+
 
 class SelectorStrategy(str, Enum):
     TEST_ID = "test_id"
@@ -30,7 +39,7 @@ class SelectorStrategy(str, Enum):
     XPATH = "xpath"
 
 
-@dataclass
+@dataclass(slots=True)
 class ElementTarget:
     ref: str
     role: str
@@ -39,7 +48,7 @@ class ElementTarget:
     selector_priority: list[SelectorStrategy]
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceStep:
     step_index: int
     action: ActionType
@@ -58,7 +67,7 @@ class WorkflowTrace:
     recorded_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterSlot:
     name: str
     step_indices: list[int]
@@ -78,7 +87,7 @@ class CompiledWorkflow:
     source_trace: WorkflowTrace | None = None  # None after disk deserialization
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     step_index: int
     success: bool
@@ -100,14 +109,18 @@ class ExecutionResult:
     total_latency_ms: float = 0.0
 
 
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+
+@functools.lru_cache(maxsize=1024)
 def normalize_task(description: str) -> str:
     """Lowercase, strip punctuation, collapse whitespace."""
-    text = description.lower()
-    text = text.translate(str.maketrans("", "", string.punctuation))
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    # str.split() with no separator collapses runs of (Unicode) whitespace and
+    # drops leading/trailing ones — same as re.sub(r"\s+", " ", ...).strip()
+    return " ".join(description.lower().translate(_PUNCT_TABLE).split())
 
 
+@functools.lru_cache(maxsize=1024)
 def make_fingerprint(task_description: str) -> str:
     """sha256 of normalized task description."""
     return hashlib.sha256(normalize_task(task_description).encode()).hexdigest()
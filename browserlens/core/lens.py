@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
+import dataclasses
 import time
-from typing import Callable
-
-from playwright.async_api import Page
+from typing import TYPE_CHECKING, Any, Callable
 
 from browserlens.compiler.cache import WorkflowCache
 from browserlens.compiler.compiler import WorkflowCompiler
@@ -19,7 +18,7 @@ from browserlens.compiler.types import (
     ParameterSlot,
     WorkflowTrace,
 )
-from browserlens.core.types import ObservationResult, RepresentationType
+from browserlens.core.types import ObservationResult, PageState, RepresentationType
 from browserlens.differ.differ import StateDiffer
 from browserlens.extractors.a11y import A11yExtractor
 from browserlens.extractors.dom import DOMExtractor
@@ -29,6 +28,26 @@ from browserlens.formatter.formatter import OutputFormatter
 from browserlens.formatter.ref_manager import RefManager
 from browserlens.router.router import AdaptiveRouter
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+# Returns [document id, DOM version]. The MutationObserver is installed on
+# first call per document; user input is counted too, since typing into a
+# field changes its value without mutating the DOM.
+_DOM_VERSION_JS = """() => {
+    if (window.__browserlensDomVersion === undefined) {
+        window.__browserlensDomVersion = 0;
+        const bump = () => { window.__browserlensDomVersion++; };
+        new MutationObserver(bump).observe(document, {
+            subtree: true, childList: true, attributes: true, characterData: true,
+        });
+        for (const type of ['input', 'change', 'focusin', 'focusout']) {
+            document.addEventListener(type, bump, true);
+        }
+    }
+    return [performance.timeOrigin, window.__browserlensDomVersion];
+}"""
+
 
 class BrowserLens:
     """
@@ -50,13 +69,20 @@ class BrowserLens:
         force_representation: RepresentationType | None = None,
         router_override: Callable | None = None,
         cache_dir: str | None = None,
+        enable_observation_cache: bool = False,
+        screenshot_max_side: int | None = None,
     ) -> None:
         self.token_budget = token_budget
         self.enable_diffing = enable_diffing
         self.enable_routing = enable_routing
         self.force_representation = force_representation
+        self.enable_observation_cache = enable_observation_cache
 
         self._step = 0
+        # Last extracted state and the page key it was taken at, reused by
+        # observe() while the page reports no DOM changes since
+        self._last_state: PageState | None = None
+        self._last_state_key: tuple[Any, ...] | None = None
         self._ref_manager = RefManager()
         self._router = AdaptiveRouter(override=router_override)
         self._differ = StateDiffer()
@@ -67,8 +93,12 @@ class BrowserLens:
         self._extractors = {
             RepresentationType.A11Y_TREE: A11yExtractor(self._ref_manager),
             RepresentationType.DISTILLED_DOM: DOMExtractor(self._ref_manager),
-            RepresentationType.VISION: VisionExtractor(self._ref_manager),
-            RepresentationType.HYBRID: HybridExtractor(self._ref_manager),
+            RepresentationType.VISION: VisionExtractor(
+                self._ref_manager, max_side=screenshot_max_side
+            ),
+            RepresentationType.HYBRID: HybridExtractor(
+                self._ref_manager, max_side=screenshot_max_side
+            ),
         }
 
         # Layer 3 — Workflow Compiler components
@@ -96,10 +126,18 @@ class BrowserLens:
         else:
             rep_type = RepresentationType.A11Y_TREE
 
-        # Extract page state
-        extractor = self._extractors[rep_type]
-        page_state = await extractor.extract(page)
-        page_state.step = self._step
+        # Read before extracting, so mutations during extraction miss next time
+        state_key = await self._page_key(page, rep_type)
+        if state_key is not None and state_key == self._last_state_key:
+            # Page unchanged since the last extraction: skip extraction
+            page_state = dataclasses.replace(self._last_state, step=self._step)
+        else:
+            extractor = self._extractors[rep_type]
+            page_state = await extractor.extract(page)
+            page_state.step = self._step
+        self._last_state = page_state
+        # Canvas repaints don't bump the DOM version, so never reuse a screenshot
+        self._last_state_key = state_key if page_state.screenshot_b64 is None else None
 
         diff_discarded = False
 
@@ -145,6 +183,22 @@ class BrowserLens:
         self._step = 0
         self._ref_manager.reset()
         self._differ.reset()
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Force the next observe() to re-extract even if the page looks unchanged."""
+        self._last_state = None
+        self._last_state_key = None
+
+    async def _page_key(self, page: Page, rep_type: RepresentationType) -> tuple[Any, ...] | None:
+        """(url, document id, DOM version, representation), or None when caching is off or unavailable."""
+        if not self.enable_observation_cache:
+            return None
+        try:
+            time_origin, dom_version = await page.evaluate(_DOM_VERSION_JS)
+        except Exception:
+            return None
+        return (page.url, time_origin, dom_version, rep_type)
 
     # ------------------------------------------------------------------
     # Layer 3 — Workflow Compiler public API
@@ -0,0 +1,49 @@
+"""Page functions installed once per page and then called by name."""
+
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+
+class PageScript:
+    """
+    A JS function installed on each page as window.<global_name>.
+
+    It is registered as an init script for documents loaded later and
+    evaluated into the current one, so each call only ships its arguments
+    over CDP instead of the whole function source. The function must not
+    return null: a null result means the document lost it, and triggers a
+    reinstall. call_many runs the function over a list of arguments in a
+    single round trip.
+    """
+
+    def __init__(self, global_name: str, function_js: str) -> None:
+        self._init_script = f"window.{global_name} = {function_js.strip()};"
+        self._install_js = "() => { " + self._init_script + " }"
+        self._call_js = f"(args) => window.{global_name} ? window.{global_name}(args) : null"
+        self._call_many_js = (
+            f"(list) => window.{global_name} ? list.map((a) => window.{global_name}(a)) : null"
+        )
+        self._installed: weakref.WeakSet[Page] = weakref.WeakSet()
+
+    async def call(self, page: Page, args: Any = None) -> Any:
+        return await self._run(page, self._call_js, args)
+
+    async def call_many(self, page: Page, args_list: list[Any]) -> list[Any]:
+        return await self._run(page, self._call_many_js, args_list)
+
+    async def _run(self, page: Page, call_js: str, args: Any) -> Any:
+        if page not in self._installed:
+            await page.add_init_script(self._init_script)
+            self._installed.add(page)
+        else:
+            result = await page.evaluate(call_js, args)
+            if result is not None:
+                return result
+        # First call on this page, or the document lost the function
+        await page.evaluate(self._install_js)
+        return await page.evaluate(call_js, args)
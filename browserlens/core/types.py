@@ -2,9 +2,25 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
+from urllib.parse import urlsplit
+
+# scheme://netloc of an ordinary URL. Anything urlsplit would clean up or
+# reject (whitespace, control characters, brackets) falls through to it.
+_ORIGIN_RE = re.compile(r"([A-Za-z][A-Za-z0-9+.-]*)://([^/?#\[\]\t\r\n]*)(?=[/?#]|\Z)")
+
+
+def url_origin(url: str) -> str:
+    """Return "scheme://netloc" for url, as urllib.parse would split it."""
+    m = _ORIGIN_RE.match(url)
+    if m is None:
+        parsed = urlsplit(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+    return f"{m[1].lower()}://{m[2]}"
 
 
 class RepresentationType(str, Enum):
@@ -14,7 +30,7 @@ class RepresentationType(str, Enum):
     HYBRID = "hybrid"  # a11y + selective screenshot
 
 
-@dataclass
+@dataclass(slots=True)
 class StateNode:
     """A single node in the accessibility/DOM tree."""
 
@@ -36,6 +52,18 @@ class StateNode:
         return (self.role, self.name)
 
     def to_dict(self) -> dict[str, Any]:
+        root = self._shallow_dict()
+        # Explicit stack instead of recursion: each child dict is appended to
+        # its parent's list when popped, children pushed reversed for order
+        stack = [(child, root["children"]) for child in reversed(self.children)]
+        while stack:
+            node, siblings = stack.pop()
+            d = node._shallow_dict()
+            siblings.append(d)
+            stack.extend((child, d["children"]) for child in reversed(node.children))
+        return root
+
+    def _shallow_dict(self) -> dict[str, Any]:
         return {
             "ref": self.ref,
             "role": self.role,
@@ -46,12 +74,12 @@ class StateNode:
             "disabled": self.disabled,
             "focused": self.focused,
             "live": self.live,
-            "children": [c.to_dict() for c in self.children],
+            "children": [],
             "attributes": self.attributes,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PageState:
     """Full snapshot of a page at a given moment."""
 
@@ -62,19 +90,46 @@ class PageState:
     screenshot_b64: str | None = None  # set when representation includes vision
     step: int = 0  # agent step number that produced this state
     raw_token_count: int = 0  # tokens in the full (unfiltered) representation
+    # Lazily built set of (role, name) pairs; snapshots are not mutated after creation
+    _role_name_index: frozenset[tuple[str, str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _node_count: int | None = field(default=None, init=False, repr=False, compare=False)
 
-    def flat_nodes(self) -> list[StateNode]:
-        """Return all nodes as a flat list (depth-first)."""
-        result: list[StateNode] = []
+    @property
+    def node_count(self) -> int:
+        """Number of nodes in the tree, counted once on first access."""
+        if self._node_count is None:
+            count = 0
+            stack = [self.root]
+            while stack:
+                node = stack.pop()
+                count += 1
+                stack.extend(node.children)  # order is irrelevant when counting
+            self._node_count = count
+        return self._node_count
+
+    def has_node(self, role: str, name: str) -> bool:
+        """True if any node in the tree has this role and accessible name."""
+        if self._role_name_index is None:
+            self._role_name_index = frozenset(n.fingerprint for n in self.iter_nodes())
+        return (role, name) in self._role_name_index
+
+    def iter_nodes(self) -> Iterator[StateNode]:
+        """Yield all nodes depth-first without building a list."""
         stack = [self.root]
         while stack:
             node = stack.pop()
-            result.append(node)
-            stack.extend(reversed(node.children))
-        return result
+            yield node
+            if node.children:
+                stack.extend(reversed(node.children))
+
+    def flat_nodes(self) -> list[StateNode]:
+        """Return all nodes as a flat list (depth-first)."""
+        return list(self.iter_nodes())
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeChange:
     """A change to a single node between two PageState snapshots."""
 
@@ -84,7 +139,7 @@ class NodeChange:
     changed_props: dict[str, tuple[Any, Any]]  # prop -> (old, new)
 
 
-@dataclass
+@dataclass(slots=True)
 class Delta:
     """The diff between two consecutive PageState snapshots."""
 
@@ -106,7 +161,7 @@ class Delta:
         return len(self.added) + len(self.removed) + len(self.changed)
 
 
-@dataclass
+@dataclass(slots=True)
 class PageSignals:
     """Fast signals collected by the router before choosing a representation."""
 
@@ -122,12 +177,10 @@ class PageSignals:
 
     @property
     def origin(self) -> str:
-        from urllib.parse import urlparse
-        parsed = urlparse(self.url)
-        return f"{parsed.scheme}://{parsed.netloc}"
+        return url_origin(self.url)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObservationResult:
     """What BrowserLens returns to the agent after observe()."""
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from browserlens.core.types import Delta, PageState, RepresentationType, StateNode
 from browserlens.differ.semantic_filter import SemanticFilter
 from browserlens.differ.snapshot_store import SnapshotStore
-from browserlens.differ.tree_diff import diff_trees
+from browserlens.differ.tree_diff import TreeIndex, diff_trees, index_tree
 
 
 class StateDiffer:
@@ -17,10 +17,14 @@ class StateDiffer:
     def __init__(self) -> None:
         self._store = SnapshotStore()
         self._filter = SemanticFilter()
+        # Index of the stored previous state, reused as the old side next step
+        self._prev_index: TreeIndex | None = None
 
     def diff(self, current: PageState) -> Delta:
         previous = self._store.get_previous()
+        old_index = self._prev_index
         self._store.update(current)
+        self._prev_index = None
 
         if previous is None:
             # First step — no previous state to diff against
@@ -28,19 +32,21 @@ class StateDiffer:
                 step=current.step,
                 is_full_state=True,
                 representation_type=current.representation_type,
-                unchanged_count=len(current.flat_nodes()),
+                unchanged_count=current.node_count,
             )
 
+        new_index = index_tree(current.root)
+        self._prev_index = new_index
         delta = diff_trees(
             old_root=previous.root,
             new_root=current.root,
             step=current.step,
             rep_type=current.representation_type,
+            old_index=old_index,
+            new_index=new_index,
+            noise_filter=self._filter,
         )
 
-        # Apply semantic noise filter
-        delta = self._filter.filter(delta)
-
         # Build human-readable unchanged summary
         delta.unchanged_summary = self._summarize_unchanged(
             current.root, delta
@@ -56,15 +62,17 @@ class StateDiffer:
     def force_full_state(self, current: PageState) -> Delta:
         """Update the store and return a full-state delta without running tree diff."""
         self._store.update(current)
+        self._prev_index = None
         return Delta(
             step=current.step,
             is_full_state=True,
             representation_type=current.representation_type,
-            unchanged_count=len(current.flat_nodes()),
+            unchanged_count=current.node_count,
         )
 
     def reset(self) -> None:
         self._store.reset()
+        self._prev_index = None
 
     def _summarize_unchanged(self, root: StateNode, delta: Delta) -> str:
         """
@@ -82,9 +90,9 @@ class StateDiffer:
 
         stable_landmarks: list[str] = []
         for child in root.children:
-            if child.ref not in noisy_refs and not _subtree_has_refs(child, noisy_refs):
+            count = _stable_leaf_count(child, noisy_refs)
+            if count:
                 label = child.name or child.role
-                count = _count_leaves(child)
                 if count > 1:
                     stable_landmarks.append(f"{label} ({count} items)")
                 else:
@@ -99,13 +107,21 @@ class StateDiffer:
         return f"{delta.unchanged_count} nodes unchanged"
 
 
-def _subtree_has_refs(node: StateNode, refs: set[str]) -> bool:
-    if node.ref in refs:
-        return True
-    return any(_subtree_has_refs(c, refs) for c in node.children)
-
+def _stable_leaf_count(node: StateNode, refs: set[str]) -> int:
+    """
+    Leaf count of node's subtree, or 0 if any node in it has a ref in refs.
 
-def _count_leaves(node: StateNode) -> int:
-    if not node.children:
-        return 1
-    return sum(_count_leaves(c) for c in node.children)
+    One iterative walk replaces separate has-refs and leaf-count recursions,
+    and stops at the first noisy ref.
+    """
+    leaves = 0
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if n.ref in refs:
+            return 0
+        if n.children:
+            stack.extend(n.children)
+        else:
+            leaves += 1
+    return leaves
@@ -6,22 +6,25 @@ import re
 
 from browserlens.core.types import Delta, NodeChange, StateNode
 
-# Patterns that indicate timer / clock / live-counter content
-_TIMER_PATTERNS = [
-    re.compile(r"^\d{1,2}:\d{2}(:\d{2})?$"),            # HH:MM or HH:MM:SS
-    re.compile(r"^\d+\s*(second|minute|hour|sec|min)s?\s*ago$", re.I),
-    re.compile(r"^(just now|moments ago)$", re.I),
-    re.compile(r"^\d{1,3}%$"),                            # pure percentage (progress bars)
-]
+# Timer / clock / live-counter content, as one alternation so each check is a
+# single match call
+_TIMER_RE = re.compile(
+    r"^(?:"
+    r"\d{1,2}:\d{2}(?::\d{2})?"                           # HH:MM or HH:MM:SS
+    r"|\d+\s*(?:second|minute|hour|sec|min)s?\s*ago"
+    r"|just now|moments ago"
+    r"|\d{1,3}%"                                          # pure percentage (progress bars)
+    r")$",
+    re.I,
+)
 
 # aria-live regions that change frequently but carry little agent-relevant info
 _NOISY_LIVE_ROLES = {"status", "timer", "marquee", "log"}
 
-# Names/roles that typically indicate decorative or ad content
-_AD_HINTS = re.compile(
-    r"(advertisement|sponsored|promoted|ad choice|ad by)",
-    re.I,
-)
+# Names/roles that typically indicate decorative or ad content. Matched
+# against casefolded text: a case-sensitive search is several times cheaper
+# than re.I on this alternation.
+_AD_HINTS = re.compile(r"advertisement|sponsored|promoted|ad choice|ad by")
 
 
 class SemanticFilter:
@@ -43,14 +46,14 @@ class SemanticFilter:
     """
 
     def filter(self, delta: Delta) -> Delta:
-        delta.added = [n for n in delta.added if not self._is_noisy_node(n)]
-        delta.removed = [n for n in delta.removed if not self._is_noisy_node(n)]
-        delta.changed = [c for c in delta.changed if not self._is_noisy_change(c)]
+        delta.added = [n for n in delta.added if not self.is_noisy_node(n)]
+        delta.removed = [n for n in delta.removed if not self.is_noisy_node(n)]
+        delta.changed = [c for c in delta.changed if not self.is_noisy_change(c)]
         return delta
 
-    def _is_noisy_node(self, node: StateNode) -> bool:
+    def is_noisy_node(self, node: StateNode) -> bool:
         # Ad content
-        if _AD_HINTS.search(node.name):
+        if _AD_HINTS.search(node.name.casefold()):
             return True
         # Timer-like text nodes
         if node.role in ("text", "StaticText", "generic") and self._is_timer_text(node.name):
@@ -60,9 +63,9 @@ class SemanticFilter:
             return True
         return False
 
-    def _is_noisy_change(self, change: NodeChange) -> bool:
+    def is_noisy_change(self, change: NodeChange) -> bool:
         # Ad content
-        if _AD_HINTS.search(change.name):
+        if _AD_HINTS.search(change.name.casefold()):
             return True
         # Only "value" changed on a timer-like node
         if set(change.changed_props.keys()) == {"value"}:
@@ -72,5 +75,4 @@ class SemanticFilter:
         return False
 
     def _is_timer_text(self, text: str) -> bool:
-        text = text.strip()
-        return any(p.match(text) for p in _TIMER_PATTERNS)
+        return _TIMER_RE.match(text.strip()) is not None
@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+from collections import deque
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 from browserlens.core.types import Delta, NodeChange, RepresentationType, StateNode
+from browserlens.differ.semantic_filter import SemanticFilter
 
 # Properties compared between matched nodes
 _COMPARED_PROPS: tuple[str, ...] = (
     "value", "checked", "expanded", "disabled", "focused", "live",
 )
+_PROP_GETTER = attrgetter(*_COMPARED_PROPS)
+
+
+@dataclass(slots=True)
+class TreeIndex:
+    """Flat ref map of a tree plus a Merkle hash of its whole content."""
+
+    nodes: dict[str, tuple[StateNode, str]]  # ref → (node, parent_role)
+    root_hash: int
 
 
 def diff_trees(
@@ -17,6 +30,10 @@ def diff_trees(
     new_root: StateNode,
     step: int,
     rep_type: RepresentationType,
+    *,
+    old_index: TreeIndex | None = None,
+    new_index: TreeIndex | None = None,
+    noise_filter: SemanticFilter | None = None,
 ) -> Delta:
     """
     Diff two StateNode trees.
@@ -24,53 +41,76 @@ def diff_trees(
     Matching strategy (in priority order):
       1. Exact ref ID match (most reliable when IDs persist)
       2. (role, name, parent_role) fingerprint match
+
+    Pass indexes from index_tree() to avoid re-indexing a tree that was
+    already indexed for the previous step. With a noise_filter, noisy
+    nodes and changes are dropped as they are found rather than in a
+    second pass over the finished Delta.
     """
-    old_nodes = _index_nodes(old_root)
-    new_nodes = _index_nodes(new_root)
+    if old_index is None:
+        old_index = index_tree(old_root)
+    if new_index is None:
+        new_index = index_tree(new_root)
+    old_nodes = old_index.nodes
+    new_nodes = new_index.nodes
+
+    if old_index.root_hash == new_index.root_hash:
+        # Identical trees: nothing to match
+        return Delta(
+            step=step,
+            unchanged_count=len(new_nodes),
+            representation_type=rep_type,
+        )
+
+    # (role, name, parent_role) -> old refs with that fingerprint, in tree order
+    fp_index: dict[tuple[str, str, str], deque[str]] = {}
+    for old_ref, (old_node, old_parent_role) in old_nodes.items():
+        fp_index.setdefault((old_node.role, old_node.name, old_parent_role), deque()).append(old_ref)
 
     added: list[StateNode] = []
     removed: list[StateNode] = []
     changed: list[NodeChange] = []
     matched_old_refs: set[str] = set()
+    # Counted before noise filtering, which must not inflate unchanged_count
+    added_count = changed_count = 0
 
     for new_ref, (new_node, new_parent_role) in new_nodes.items():
         if new_ref in old_nodes:
             # Matched by ref ID
-            old_node, _ = old_nodes[new_ref]
-            matched_old_refs.add(new_ref)
-            props_diff = _compare_props(old_node, new_node)
-            if props_diff:
-                changed.append(NodeChange(
-                    ref=new_ref,
-                    role=new_node.role,
-                    name=new_node.name,
-                    changed_props=props_diff,
-                ))
+            old_ref: str | None = new_ref
         else:
             # Try fingerprint match
-            fp = (new_node.role, new_node.name, new_parent_role)
-            old_match = _find_by_fingerprint(fp, old_nodes, matched_old_refs)
-            if old_match is not None:
-                old_ref, old_node = old_match
-                matched_old_refs.add(old_ref)
-                props_diff = _compare_props(old_node, new_node)
-                if props_diff:
-                    changed.append(NodeChange(
-                        ref=new_ref,
-                        role=new_node.role,
-                        name=new_node.name,
-                        changed_props=props_diff,
-                    ))
-            else:
-                # Truly new node
+            old_ref = _pop_unmatched(
+                fp_index.get((new_node.role, new_node.name, new_parent_role)),
+                matched_old_refs,
+            )
+        if old_ref is None:
+            # Truly new node
+            added_count += 1
+            if noise_filter is None or not noise_filter.is_noisy_node(new_node):
                 added.append(new_node)
+            continue
+        old_node, _ = old_nodes[old_ref]
+        matched_old_refs.add(old_ref)
+        props_diff = _compare_props(old_node, new_node)
+        if props_diff:
+            changed_count += 1
+            change = NodeChange(
+                ref=new_ref,
+                role=new_node.role,
+                name=new_node.name,
+                changed_props=props_diff,
+            )
+            if noise_filter is None or not noise_filter.is_noisy_change(change):
+                changed.append(change)
 
     # Any old node not matched = removed
     for old_ref, (old_node, _) in old_nodes.items():
         if old_ref not in matched_old_refs:
-            removed.append(old_node)
+            if noise_filter is None or not noise_filter.is_noisy_node(old_node):
+                removed.append(old_node)
 
-    unchanged_count = len(new_nodes) - len(added) - len(changed)
+    unchanged_count = len(new_nodes) - added_count - changed_count
 
     return Delta(
         step=step,
@@ -82,39 +122,64 @@ def diff_trees(
     )
 
 
-def _index_nodes(root: StateNode) -> dict[str, tuple[StateNode, str]]:
-    """Flat map: ref → (node, parent_role) via depth-first traversal."""
+def index_tree(root: StateNode) -> TreeIndex:
+    """
+    Index a tree in one depth-first pass.
+
+    Nodes are mapped ref → (node, parent_role) in pre-order. Each subtree is
+    hashed bottom-up over its ref, role, name, compared props and child
+    hashes, so two trees with equal root hashes need no further diffing.
+    Only whole trees are compared this way: refs may repeat within a tree,
+    and the flat map keeps the last occurrence, so skipping matched
+    subtrees individually would change which nodes get matched.
+    """
     result: dict[str, tuple[StateNode, str]] = {}
-    _walk(root, parent_role="", result=result)
-    return result
-
-
-def _walk(node: StateNode, parent_role: str, result: dict[str, tuple[StateNode, str]]) -> None:
-    result[node.ref] = (node, parent_role)
-    for child in node.children:
-        _walk(child, parent_role=node.role, result=result)
-
-
-def _compare_props(old: StateNode, new: StateNode) -> dict[str, tuple[Any, Any]]:
-    diff: dict[str, tuple[Any, Any]] = {}
-    for prop in _COMPARED_PROPS:
-        old_val = getattr(old, prop)
-        new_val = getattr(new, prop)
-        if old_val != new_val:
-            diff[prop] = (old_val, new_val)
-    return diff
-
-
-def _find_by_fingerprint(
-    fp: tuple[str, str, str],
-    old_nodes: dict[str, tuple[StateNode, str]],
-    already_matched: set[str],
-) -> tuple[str, StateNode] | None:
-    """Find first unmatched old node with the same (role, name, parent_role) fingerprint."""
-    role, name, parent_role = fp
-    for ref, (node, node_parent_role) in old_nodes.items():
-        if ref in already_matched:
-            continue
-        if node.role == role and node.name == name and node_parent_role == parent_role:
-            return ref, node
+    hashes: list[int] = []
+    # Explicit stack instead of recursion: no frame per node, no recursion
+    # limit on deep trees. Children are pushed reversed to keep pre-order;
+    # a None parent_role marks the post-order visit that hashes the node.
+    stack: list[tuple[StateNode, str | None]] = [(root, "")]
+    while stack:
+        node, parent_role = stack.pop()
+        children = node.children
+        if parent_role is not None:
+            result[node.ref] = (node, parent_role)
+            if children:
+                stack.append((node, None))
+                role = node.role
+                stack.extend((child, role) for child in reversed(children))
+                continue
+            child_hashes: tuple[int, ...] = ()
+        else:
+            child_hashes = tuple(hashes[-len(children):])
+            del hashes[-len(children):]
+        hashes.append(hash((
+            node.ref, node.role, node.name, node.value, node.checked,
+            node.expanded, node.disabled, node.focused, node.live, child_hashes,
+        )))
+    return TreeIndex(nodes=result, root_hash=hashes[0])
+
+
+def _compare_props(old: StateNode, new: StateNode) -> dict[str, tuple[Any, Any]] | None:
+    old_vals = _PROP_GETTER(old)
+    new_vals = _PROP_GETTER(new)
+    # One tuple compare covers the common case of an unchanged node
+    if old_vals == new_vals:
+        return None
+    return {
+        prop: (old_val, new_val)
+        for prop, old_val, new_val in zip(_COMPARED_PROPS, old_vals, new_vals)
+        if old_val != new_val
+    }
+
+
+def _pop_unmatched(candidates: deque[str] | None, already_matched: set[str]) -> str | None:
+    """Pop the first old ref from candidates that hasn't been matched yet."""
+    if not candidates:
+        return None
+    # Refs matched by exact ID after being indexed are dropped lazily here
+    while candidates:
+        ref = candidates.popleft()
+        if ref not in already_matched:
+            return ref
     return None
@@ -8,13 +8,18 @@ to reconstruct an equivalent tree as StateNode objects.
 
 from __future__ import annotations
 
-from typing import Any
-
-from playwright.async_api import Page
+import asyncio
+import contextlib
+import sys
+import weakref
+from typing import TYPE_CHECKING, Any
 
 from browserlens.core.types import StateNode
 from browserlens.formatter.ref_manager import RefManager
 
+if TYPE_CHECKING:
+    from playwright.async_api import CDPSession, Page
+
 # Internal Chrome role names → normalised role strings
 _INTERNAL_ROLE_MAP: dict[str, str] = {
     "RootWebArea": "document",
@@ -27,6 +32,14 @@ _INTERNAL_ROLE_MAP: dict[str, str] = {
     "LayoutTableCell": "cell",
 }
 
+# One CDP session per page, reused across extractions instead of attaching
+# and detaching on every call; an entry is dropped when its page closes.
+# Entries are the task opening the session, so concurrent first calls share it.
+_SESSIONS: "weakref.WeakKeyDictionary[Page, asyncio.Future[CDPSession]]" = weakref.WeakKeyDictionary()
+
+# Error text Playwright uses when a session's page, target or connection went away
+_STALE_SESSION_ERRORS = ("closed", "detached")
+
 # Roles with no semantic meaning — pruned when they have no name AND no children
 _STRUCTURAL_ROLES = frozenset({
     "generic", "none", "presentation", "text",
@@ -56,11 +69,16 @@ async def extract_ax_tree(page: Page, ref_manager: RefManager) -> StateNode:
     Equivalent to the old page.accessibility.snapshot(interesting_only=True)
     but compatible with Playwright 1.46+.
     """
-    cdp = await page.context.new_cdp_session(page)
+    cdp = await _session_for(page)
     try:
         result = await cdp.send("Accessibility.getFullAXTree")
-    finally:
-        await cdp.detach()
+    except Exception as exc:
+        if not any(marker in str(exc).lower() for marker in _STALE_SESSION_ERRORS):
+            raise
+        # The cached session was detached; replace it and retry once
+        await _drop_session(page, cdp)
+        cdp = await _session_for(page)
+        result = await cdp.send("Accessibility.getFullAXTree")
 
     nodes: list[dict] = result.get("nodes", [])
     if not nodes:
@@ -70,6 +88,44 @@ async def extract_ax_tree(page: Page, ref_manager: RefManager) -> StateNode:
     return _build_tree(nodes, ref_manager)
 
 
+async def _session_for(page: Page) -> CDPSession:
+    """Return the page's cached CDP session, opening one on first use."""
+    opening = _SESSIONS.get(page)
+    if opening is None:
+        opening = asyncio.ensure_future(page.context.new_cdp_session(page))
+        _SESSIONS[page] = opening
+        page.once("close", lambda _: _drop_session(page))
+    try:
+        # Shielded so one cancelled caller doesn't abort the shared open
+        return await asyncio.shield(opening)
+    except Exception:
+        if _SESSIONS.get(page) is opening:
+            del _SESSIONS[page]
+        raise
+
+
+async def _drop_session(page: Page, session: CDPSession | None = None) -> None:
+    """
+    Forget the page's cached CDP session and detach it. With session given,
+    the cache entry is only dropped if it is still that session (a concurrent
+    caller may already have replaced it); session itself is detached either way.
+    """
+    opening = _SESSIONS.get(page)
+    if opening is not None and (
+        session is None
+        or (opening.done() and not opening.cancelled()
+            and opening.exception() is None and opening.result() is session)
+    ):
+        del _SESSIONS[page]
+        if session is None:
+            with contextlib.suppress(Exception):
+                session = await opening
+    if session is not None:
+        # A session whose target already went away fails to detach; that's fine
+        with contextlib.suppress(Exception):
+            await session.detach()
+
+
 def _build_tree(nodes: list[dict], ref_manager: RefManager) -> StateNode:
     if not nodes:
         fp = ("document", "", "")
@@ -89,9 +145,58 @@ def _convert_node(
     ref_manager: RefManager,
     parent_role: str,
 ) -> StateNode:
+    """
+    Convert raw and its descendants into a StateNode subtree.
+
+    Ignored nodes are skipped but traversed: their non-ignored descendants
+    are attached to the nearest kept ancestor. The walk uses an explicit
+    stack, so deep trees cannot hit the recursion limit; refs are still
+    issued in pre-order and children appended in document order.
+    """
+    root = _make_node(raw, ref_manager, parent_role)
+    # Children are attached as they are created; a None raw marks the
+    # post-order visit that prunes a node's children once their own
+    # subtrees are complete, since _is_interesting looks at children.
+    stack: list[tuple[dict | None, StateNode, str]] = [(None, root, "")]
+    _push_children(stack, raw, root, root.role, by_id)
+    while stack:
+        raw, parent, parent_role = stack.pop()
+        if raw is None:
+            if parent.children:
+                parent.children = [c for c in parent.children if _is_interesting(c)]
+            continue
+        if raw.get("ignored"):
+            # Skip the node itself; its descendants attach to the kept parent
+            _push_children(stack, raw, parent, parent_role, by_id)
+            continue
+        node = _make_node(raw, ref_manager, parent_role)
+        parent.children.append(node)
+        stack.append((None, node, ""))
+        _push_children(stack, raw, node, node.role, by_id)
+    return root
+
+
+def _push_children(
+    stack: list[tuple[dict | None, StateNode, str]],
+    raw: dict,
+    parent: StateNode,
+    parent_role: str,
+    by_id: dict[str, dict],
+) -> None:
+    """Push raw's known children, reversed so they pop in document order."""
+    for child_id in reversed(raw.get("childIds", [])):
+        child_raw = by_id.get(child_id)
+        if child_raw is not None:
+            stack.append((child_raw, parent, parent_role))
+
+
+def _make_node(raw: dict, ref_manager: RefManager, parent_role: str) -> StateNode:
+    """Build a single childless StateNode from a raw CDP node."""
     role_raw = raw.get("role", {})
     raw_role = role_raw.get("value", "generic") or "generic"
-    role = _INTERNAL_ROLE_MAP.get(raw_role, raw_role)
+    # Interned: roles and live values come from a small vocabulary and are
+    # hashed and compared on every fingerprint lookup and diff
+    role = sys.intern(_INTERNAL_ROLE_MAP.get(raw_role, raw_role))
 
     name = str(_ax_value(raw.get("name")) or "")
     value_raw = _ax_value(raw.get("value"))
@@ -119,12 +224,12 @@ def _convert_node(
 
     # aria-live
     live_raw = props.get("live")
-    live = str(live_raw) if live_raw and live_raw not in ("off", "none", False, None) else ""
+    live = sys.intern(str(live_raw)) if live_raw and live_raw not in ("off", "none", False, None) else ""
 
     fp = (role, name, parent_role)
     ref = ref_manager.get_or_create(fp)
 
-    node = StateNode(
+    return StateNode(
         ref=ref,
         role=role,
         name=name,
@@ -136,43 +241,6 @@ def _convert_node(
         live=live,
     )
 
-    # Process children — skip ignored nodes but keep traversing through them
-    for child_id in raw.get("childIds", []):
-        child_raw = by_id.get(child_id)
-        if child_raw is None:
-            continue
-        if child_raw.get("ignored"):
-            # Collect non-ignored descendants and attach them here
-            for grandchild in _collect_unignored(child_raw, by_id, ref_manager, role):
-                if _is_interesting(grandchild):
-                    node.children.append(grandchild)
-        else:
-            child_node = _convert_node(child_raw, by_id, ref_manager, parent_role=role)
-            if _is_interesting(child_node):
-                node.children.append(child_node)
-
-    return node
-
-
-def _collect_unignored(
-    ignored_node: dict,
-    by_id: dict[str, dict],
-    ref_manager: RefManager,
-    parent_role: str,
-) -> list[StateNode]:
-    """Return non-ignored descendants of an ignored node, flattened one level up."""
-    result: list[StateNode] = []
-    for child_id in ignored_node.get("childIds", []):
-        child_raw = by_id.get(child_id)
-        if child_raw is None:
-            continue
-        if child_raw.get("ignored"):
-            result.extend(_collect_unignored(child_raw, by_id, ref_manager, parent_role))
-        else:
-            node = _convert_node(child_raw, by_id, ref_manager, parent_role)
-            result.append(node)
-    return result
-
 
 def _is_interesting(node: StateNode) -> bool:
     """
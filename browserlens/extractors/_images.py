@@ -0,0 +1,40 @@
+"""Screenshot post-processing shared by the vision and hybrid extractors."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+
+try:
+    from PIL import Image
+    _PIL_AVAILABLE = True
+except ImportError:
+    _PIL_AVAILABLE = False
+
+# JPEG quality used when a downscaled screenshot is re-encoded
+_DOWNSCALE_QUALITY = 70
+
+
+async def downscale_jpeg(data: bytes, max_side: int | None) -> bytes:
+    """
+    Shrink a JPEG so its longer side is at most max_side pixels.
+
+    Returns data unchanged when max_side is None, the image already fits,
+    or Pillow isn't installed. Decoding and encoding run in a worker thread
+    so large screenshots don't block the event loop.
+    """
+    if max_side is None or not _PIL_AVAILABLE:
+        return data
+    return await asyncio.to_thread(_downscale, data, max_side)
+
+
+def _downscale(data: bytes, max_side: int) -> bytes:
+    with Image.open(io.BytesIO(data)) as img:
+        if max(img.size) <= max_side:
+            return data
+        # thumbnail() keeps the aspect ratio and lets libjpeg decode at a
+        # reduced scale (draft mode) before the final resample
+        img.thumbnail((max_side, max_side))
+        out = io.BytesIO()
+        img.convert("RGB").save(out, format="JPEG", quality=_DOWNSCALE_QUALITY)
+        return out.getvalue()
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from playwright.async_api import Page
+import asyncio
+from typing import TYPE_CHECKING
 
 from browserlens.core.types import PageState, RepresentationType
 from browserlens.extractors._cdp import extract_ax_tree
 from browserlens.extractors.base import BaseExtractor
 from browserlens.formatter.ref_manager import RefManager
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class A11yExtractor(BaseExtractor):
     """
@@ -24,10 +28,11 @@ class A11yExtractor(BaseExtractor):
         return RepresentationType.A11Y_TREE
 
     async def extract(self, page: Page) -> PageState:
-        root = await extract_ax_tree(page, self._refs)
+        # Independent round-trips: fetch the title while the AX tree is built
+        root, title = await asyncio.gather(extract_ax_tree(page, self._refs), page.title())
         return PageState(
             url=page.url,
-            title=await page.title(),
+            title=title,
             representation_type=self.representation_type,
             root=root,
         )
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-
-from playwright.async_api import Page
+from typing import TYPE_CHECKING
 
 from browserlens.core.types import PageState, RepresentationType
 from browserlens.formatter.ref_manager import RefManager
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class BaseExtractor(ABC):
     """All extractors share a RefManager so @eN IDs are stable across extractor switches."""
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from playwright.async_api import Page
+import asyncio
+import sys
+from typing import TYPE_CHECKING
 
+from browserlens.core.page_script import PageScript
 from browserlens.core.types import PageState, RepresentationType, StateNode
 from browserlens.extractors.base import BaseExtractor
 from browserlens.formatter.ref_manager import RefManager
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 # Elements that carry semantic/interactive meaning for an agent
 _KEPT_TAGS = {
     "a", "button", "input", "select", "textarea", "form",
@@ -77,36 +83,45 @@ _DOM_EXTRACTION_JS = """() => {
         );
     }
 
-    function serializeNode(el, depth) {
-        if (depth > 20) return null;
+    // Flat pre-order list; each entry holds its parent's index instead of a
+    // nested children array, and empty or default fields are left out
+    const nodes = [];
+
+    function serializeNode(el, depth, parent) {
+        if (depth > 20) return false;
         const tag = el.tagName;
-        if (!tag) return null;
+        if (!tag) return false;
 
-        const keep = KEPT_TAGS.has(tag);
-        const children = [];
+        const index = nodes.length;
+        const node = { parent };
+        nodes.push(node);
+        let hasChildren = false;
         for (const child of el.children) {
-            const s = serializeNode(child, depth + 1);
-            if (s) children.push(s);
+            if (serializeNode(child, depth + 1, index)) hasChildren = true;
         }
 
-        if (!keep && children.length === 0) return null;
-
-        const node = {
-            tag: tag.toLowerCase(),
-            role: getRole(el),
-            name: getName(el),
-            value: el.value || '',
-            checked: el.checked !== undefined ? el.checked : null,
-            expanded: el.getAttribute('aria-expanded'),
-            disabled: el.disabled || el.getAttribute('aria-disabled') === 'true',
-            children,
-        };
-        return node;
+        if (!KEPT_TAGS.has(tag) && !hasChildren) {
+            // Nothing kept below either, so this entry is the last one pushed
+            nodes.length = index;
+            return false;
+        }
+
+        node.role = getRole(el);
+        node.name = getName(el);
+        if (el.value) node.value = el.value;
+        if (el.checked !== undefined) node.checked = el.checked;
+        const expanded = el.getAttribute('aria-expanded');
+        if (expanded !== null) node.expanded = expanded;
+        if (el.disabled || el.getAttribute('aria-disabled') === 'true') node.disabled = true;
+        return true;
     }
 
-    return serializeNode(document.body, 0);
+    serializeNode(document.body, 0, -1);
+    return nodes;
 }"""
 
+_DOM_DISTILL = PageScript("__blDomDistill", _DOM_EXTRACTION_JS)
+
 
 class DOMExtractor(BaseExtractor):
     """
@@ -122,17 +137,34 @@ class DOMExtractor(BaseExtractor):
         return RepresentationType.DISTILLED_DOM
 
     async def extract(self, page: Page) -> PageState:
-        raw = await page.evaluate(_DOM_EXTRACTION_JS)
-        root = self._convert_node(raw or {})
+        flat, title = await asyncio.gather(_DOM_DISTILL.call(page), page.title())
+        root = self._build_tree(flat or [])
         return PageState(
             url=page.url,
-            title=await page.title(),
+            title=title,
             representation_type=self.representation_type,
             root=root,
         )
 
+    def _build_tree(self, flat: list[dict]) -> StateNode:
+        """Link the flat pre-order list from _DOM_EXTRACTION_JS into a tree."""
+        if not flat:
+            return self._convert_node({})
+        # Parents always precede their children, so one forward pass suffices
+        built: list[StateNode] = []
+        for raw in flat:
+            parent_index = raw.get("parent", -1)
+            if parent_index < 0:
+                node = self._convert_node(raw)
+            else:
+                parent = built[parent_index]
+                node = self._convert_node(raw, parent.role)
+                parent.children.append(node)
+            built.append(node)
+        return built[0]
+
     def _convert_node(self, raw: dict, parent_role: str = "") -> StateNode:
-        role = raw.get("role", "generic")
+        role = sys.intern(raw.get("role", "generic"))
         name = raw.get("name", "")
 
         fingerprint = (role, name, parent_role)
@@ -143,7 +175,7 @@ class DOMExtractor(BaseExtractor):
         if expanded_raw is not None:
             expanded = str(expanded_raw).lower() == "true"
 
-        node = StateNode(
+        return StateNode(
             ref=ref,
             role=role,
             name=name,
@@ -152,8 +184,3 @@ class DOMExtractor(BaseExtractor):
             expanded=expanded,
             disabled=raw.get("disabled", False),
         )
-
-        for child_raw in raw.get("children", []):
-            node.children.append(self._convert_node(child_raw, parent_role=role))
-
-        return node
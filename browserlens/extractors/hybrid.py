@@ -2,15 +2,34 @@
 
 from __future__ import annotations
 
-import base64
-
-from playwright.async_api import Page
+import asyncio
+import binascii
+from typing import TYPE_CHECKING
 
+from browserlens.core.page_script import PageScript
 from browserlens.core.types import PageState, RepresentationType
 from browserlens.extractors._cdp import extract_ax_tree
+from browserlens.extractors._images import downscale_jpeg
 from browserlens.extractors.base import BaseExtractor
 from browserlens.formatter.ref_manager import RefManager
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+# Document title plus bounding boxes of visible canvas-like elements, in one
+# round-trip instead of a separate page.title() call
+_CANVAS_BOXES = PageScript("__blCanvasBoxes", """() => {
+    const canvases = document.querySelectorAll('canvas, [data-canvas], [data-visual]');
+    const boxes = [];
+    for (const c of canvases) {
+        const r = c.getBoundingClientRect();
+        if (r.width > 0 && r.height > 0) {
+            boxes.push({ x: r.left, y: r.top, width: r.width, height: r.height });
+        }
+    }
+    return { title: document.title, boxes };
+}""")
+
 
 class HybridExtractor(BaseExtractor):
     """
@@ -19,46 +38,43 @@ class HybridExtractor(BaseExtractor):
     the visual context for areas that a11y cannot describe.
     """
 
-    def __init__(self, ref_manager: RefManager) -> None:
+    def __init__(self, ref_manager: RefManager, *, max_side: int | None = None) -> None:
         super().__init__(ref_manager)
+        # Longest screenshot side in pixels; larger captures are downscaled
+        # when Pillow is installed
+        self._max_side = max_side
 
     @property
     def representation_type(self) -> RepresentationType:
         return RepresentationType.HYBRID
 
     async def extract(self, page: Page) -> PageState:
-        root = await extract_ax_tree(page, self._refs)
-        screenshot_b64 = await self._capture_visual_regions(page)
+        root, (title, screenshot_b64) = await asyncio.gather(
+            extract_ax_tree(page, self._refs),
+            self._capture_visual_regions(page),
+        )
 
         return PageState(
             url=page.url,
-            title=await page.title(),
+            title=title,
             representation_type=self.representation_type,
             root=root,
             screenshot_b64=screenshot_b64,
         )
 
-    async def _capture_visual_regions(self, page: Page) -> str | None:
+    async def _capture_visual_regions(self, page: Page) -> tuple[str, str | None]:
         """
         Find canvas elements and take a cropped screenshot of their bounding box.
         If multiple canvases exist, fall back to a full viewport screenshot.
-        Returns base64 JPEG or None if no canvas elements found.
+        Returns (page title, base64 JPEG or None if no canvas elements found).
         """
-        boxes = await page.evaluate("""() => {
-            const canvases = document.querySelectorAll('canvas, [data-canvas], [data-visual]');
-            const boxes = [];
-            for (const c of canvases) {
-                const r = c.getBoundingClientRect();
-                if (r.width > 0 && r.height > 0) {
-                    boxes.push({ x: r.left, y: r.top, width: r.width, height: r.height });
-                }
-            }
-            return boxes;
-        }""")
+        found = await _CANVAS_BOXES.call(page)
+        title, boxes = found["title"], found["boxes"]
 
         if not boxes:
-            return None
+            return title, None
 
+        screenshot_bytes: bytes | None = None
         if len(boxes) == 1:
             box = boxes[0]
             try:
@@ -72,10 +88,11 @@ class HybridExtractor(BaseExtractor):
                         "height": box["height"],
                     },
                 )
-                return base64.b64encode(screenshot_bytes).decode("utf-8")
             except Exception:
                 pass
 
-        # Multiple canvases or clip failed → full viewport
-        screenshot_bytes = await page.screenshot(type="jpeg", quality=75)
-        return base64.b64encode(screenshot_bytes).decode("utf-8")
+        if screenshot_bytes is None:
+            # Multiple canvases or clip failed → full viewport
+            screenshot_bytes = await page.screenshot(type="jpeg", quality=75)
+        screenshot_bytes = await downscale_jpeg(screenshot_bytes, self._max_side)
+        return title, binascii.b2a_base64(screenshot_bytes, newline=False).decode("ascii")
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-import base64
-
-from playwright.async_api import Page
+import asyncio
+import binascii
+from typing import TYPE_CHECKING
 
 from browserlens.core.types import PageState, RepresentationType
 from browserlens.extractors._cdp import extract_ax_tree
+from browserlens.extractors._images import downscale_jpeg
 from browserlens.extractors.base import BaseExtractor
 from browserlens.formatter.ref_manager import RefManager
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class VisionExtractor(BaseExtractor):
     """
@@ -19,28 +23,41 @@ class VisionExtractor(BaseExtractor):
     The a11y tree is still extracted as a skeletal structure so diffing works.
     """
 
-    def __init__(self, ref_manager: RefManager, *, full_page: bool = False) -> None:
+    def __init__(
+        self,
+        ref_manager: RefManager,
+        *,
+        full_page: bool = False,
+        max_side: int | None = None,
+    ) -> None:
         super().__init__(ref_manager)
         self._full_page = full_page
+        # Longest screenshot side in pixels; larger captures are downscaled
+        # when Pillow is installed
+        self._max_side = max_side
 
     @property
     def representation_type(self) -> RepresentationType:
         return RepresentationType.VISION
 
     async def extract(self, page: Page) -> PageState:
-        screenshot_bytes = await page.screenshot(
-            type="jpeg",
-            quality=75,
-            full_page=self._full_page,
+        # Skeletal a11y tree so diffing has something to work with, fetched
+        # alongside the screenshot and title
+        screenshot_bytes, root, title = await asyncio.gather(
+            page.screenshot(
+                type="jpeg",
+                quality=75,
+                full_page=self._full_page,
+            ),
+            extract_ax_tree(page, self._refs),
+            page.title(),
         )
-        screenshot_b64 = base64.b64encode(screenshot_bytes).decode("utf-8")
-
-        # Skeletal a11y tree so diffing has something to work with
-        root = await extract_ax_tree(page, self._refs)
+        screenshot_bytes = await downscale_jpeg(screenshot_bytes, self._max_side)
+        screenshot_b64 = binascii.b2a_base64(screenshot_bytes, newline=False).decode("ascii")
 
         return PageState(
             url=page.url,
-            title=await page.title(),
+            title=title,
             representation_type=self.representation_type,
             root=root,
             screenshot_b64=screenshot_b64,
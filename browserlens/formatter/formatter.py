@@ -23,9 +23,7 @@ class OutputFormatter:
 
     def format_full(self, state: PageState) -> tuple[str, int]:
         """Format just the full state (ignoring any delta). Used for token-count fallback."""
-        text = self._format_full(state)
-        text, _ = self._budget.truncate(text, self._max_tokens)
-        return text, self._budget.count(text)
+        return self._fit(self._format_full(state))
 
     def format(self, state: PageState, delta: Delta | None) -> tuple[str, int]:
         """
@@ -36,10 +34,15 @@ class OutputFormatter:
             text = self._format_full(state)
         else:
             text = self._format_delta(delta, state)
+        return self._fit(text)
 
-        text, _ = self._budget.truncate(text, self._max_tokens)
+    def _fit(self, text: str) -> tuple[str, int]:
+        """Truncate text to the token budget; tokenizes once when it already fits."""
         token_count = self._budget.count(text)
-        return text, token_count
+        if token_count <= self._max_tokens:
+            return text, token_count
+        text, _ = self._budget.truncate(text, self._max_tokens)
+        return text, self._budget.count(text)
 
     # ------------------------------------------------------------------
     # Full state rendering
@@ -53,21 +56,28 @@ class OutputFormatter:
             f"Representation: {state.representation_type.value}",
             "",
         ]
-        lines += self._render_node(state.root, depth=0)
+        self._render_tree(state.root, lines)
 
         if state.screenshot_b64:
             lines += ["", "[VISUAL: screenshot attached]"]
 
         return "\n".join(lines)
 
-    def _render_node(self, node: StateNode, depth: int) -> list[str]:
-        indent = _INDENT * depth
-        parts = [f"{node.role}"]
-
-        if node.name:
-            parts.append(f'"{node.name}"')
-
-        ref_str = f" [{node.ref}]"
+    def _render_tree(self, root: StateNode, lines: list[str], prefix: str = "") -> None:
+        """Append one line per node of root's subtree to lines, in pre-order."""
+        # Explicit stack rather than recursion: no per-node result lists to
+        # merge, and deep trees can't hit the recursion limit
+        stack = [(root, prefix)]
+        while stack:
+            node, indent = stack.pop()
+            lines.append(self._line(node, indent))
+            if node.children:
+                child_indent = indent + _INDENT
+                stack.extend((child, child_indent) for child in reversed(node.children))
+
+    @staticmethod
+    def _line(node: StateNode, indent: str) -> str:
+        name_str = f' "{node.name}"' if node.name else ""
 
         props: list[str] = []
         if node.value:
@@ -82,12 +92,7 @@ class OutputFormatter:
             props.append("focused")
 
         prop_str = f" ({', '.join(props)})" if props else ""
-        line = f"{indent}- {' '.join(parts)}{ref_str}{prop_str}"
-
-        result = [line]
-        for child in node.children:
-            result += self._render_node(child, depth + 1)
-        return result
+        return f"{indent}- {node.role}{name_str} [{node.ref}]{prop_str}"
 
     # ------------------------------------------------------------------
     # Delta rendering
@@ -104,7 +109,7 @@ class OutputFormatter:
         if delta.added:
             lines.append("ADDED:")
             for node in delta.added:
-                lines += [f"  {l}" for l in self._render_node(node, depth=0)]
+                self._render_tree(node, lines, prefix=_INDENT)
 
         if delta.removed:
             lines.append("REMOVED:")
@@ -127,8 +132,7 @@ class OutputFormatter:
 
     def _render_change(self, change: NodeChange) -> str:
         name_str = f' "{change.name}"' if change.name else ""
-        prop_parts: list[str] = []
-        for prop, (old, new) in change.changed_props.items():
-            prop_parts.append(f"{prop}: {old!r} → {new!r}")
-        props_str = ", ".join(prop_parts)
+        props_str = ", ".join(
+            f"{prop}: {old!r} → {new!r}" for prop, (old, new) in change.changed_props.items()
+        )
         return f"  - {change.role}{name_str} [{change.ref}] — {props_str}"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 
 class RefManager:
     """
@@ -18,10 +20,12 @@ class RefManager:
         self._ref_to_fp: dict[str, tuple[str, str, str]] = {}
 
     def get_or_create(self, fingerprint: tuple[str, str, str]) -> str:
-        if fingerprint in self._fp_to_ref:
-            return self._fp_to_ref[fingerprint]
+        ref = self._fp_to_ref.get(fingerprint)
+        if ref is not None:
+            return ref
         self._counter += 1
-        ref = f"@e{self._counter}"
+        # Interned once here; every later lookup returns this same object
+        ref = sys.intern(f"@e{self._counter}")
         self._fp_to_ref[fingerprint] = ref
         self._ref_to_fp[ref] = fingerprint
         return ref
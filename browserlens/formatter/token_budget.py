@@ -2,44 +2,92 @@
 
 from __future__ import annotations
 
+import functools
+
 try:
     import tiktoken
-    _enc = tiktoken.get_encoding("cl100k_base")
     _TIKTOKEN_AVAILABLE = True
 except ImportError:
     _TIKTOKEN_AVAILABLE = False
 
 
+# Ratio-based truncation cuts this far past the estimated budget boundary,
+# so the prefix usually still holds at least max_tokens tokens
+_RATIO_OVERSHOOT = 1.1
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding() -> "tiktoken.Encoding":
+    """Load the cl100k_base encoding once, on first use, and share it process-wide."""
+    return tiktoken.get_encoding("cl100k_base")
+
+
 class TokenBudget:
     """
     Counts tokens in a string and truncates text to fit within a budget.
     Falls back to a character-based heuristic when tiktoken isn't available.
+
+    Text is encoded with encode_ordinary: page content is plain text, so
+    special-token markers like <|endoftext|> count as ordinary characters
+    instead of raising, and the special-token scan is skipped.
     """
 
     # Rough chars-per-token ratio for fallback
     _CHARS_PER_TOKEN = 4
 
+    def __init__(self) -> None:
+        # (len, hash, token_count) of the last tokenized string; format() and
+        # truncate() tend to count the same text more than once in a row.
+        # Keyed without the text itself so a shared budget doesn't keep the
+        # last page alive, and a miss never costs a full string compare.
+        self._last: tuple[int, int, int] | None = None
+
     def count(self, text: str) -> int:
+        if not _TIKTOKEN_AVAILABLE:
+            return max(1, len(text) // self._CHARS_PER_TOKEN)
+        key = (len(text), hash(text))
+        last = self._last
+        if last is not None and last[:2] == key:
+            return last[2]
+        n = len(_encoding().encode_ordinary(text))
+        self._last = (*key, n)
+        return n
+
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens for many strings in one tokenizer call."""
         if _TIKTOKEN_AVAILABLE:
-            return len(_enc.encode(text))
-        return max(1, len(text) // self._CHARS_PER_TOKEN)
+            return [len(tokens) for tokens in _encoding().encode_ordinary_batch(texts)]
+        return [max(1, len(text) // self._CHARS_PER_TOKEN) for text in texts]
 
     def truncate(self, text: str, max_tokens: int) -> tuple[str, bool]:
         """
         Truncate text to fit within max_tokens.
         Returns (truncated_text, was_truncated).
         """
-        if self.count(text) <= max_tokens:
+        token_count = self.count(text)
+        if token_count <= max_tokens:
             return text, False
 
         if _TIKTOKEN_AVAILABLE:
-            tokens = _enc.encode(text)
-            truncated = _enc.decode(tokens[:max_tokens])
+            truncated = self._truncate_by_ratio(text, token_count, max_tokens)
         else:
             max_chars = max_tokens * self._CHARS_PER_TOKEN
             truncated = text[:max_chars]
 
         return truncated + "\n[... truncated to fit token budget ...]", True
 
+    def _truncate_by_ratio(self, text: str, token_count: int, max_tokens: int) -> str:
+        """
+        Return the first max_tokens tokens of text, encoding only a prefix
+        sized from its chars-per-token ratio. Falls back to encoding the
+        whole text if that prefix turns out to be too short.
+        """
+        enc = _encoding()
+        cut = int(len(text) * max_tokens / token_count * _RATIO_OVERSHOOT)
+        tokens = enc.encode_ordinary(text[:cut])
+        if len(tokens) <= max_tokens:
+            tokens = enc.encode_ordinary(text)
+        return enc.decode(tokens[:max_tokens])
+
     def fits(self, text: str, max_tokens: int) -> bool:
         return self.count(text) <= max_tokens
@@ -3,31 +3,35 @@
 from __future__ import annotations
 
 import time
-from typing import Callable
-from urllib.parse import urlparse
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable
 
-from playwright.async_api import Page
-
-from browserlens.core.types import PageSignals, RepresentationType
+from browserlens.core.types import PageSignals, RepresentationType, url_origin
 from browserlens.router.signals import SignalExtractor
 from browserlens.router.strategies import RepresentationStrategy
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 # Cache TTL for origin-level signal caching (seconds)
 _CACHE_TTL = 60.0
+# Most origins kept at once; the least recently used is evicted beyond this
+_CACHE_MAX_ORIGINS = 4096
 
 
 class AdaptiveRouter:
     """
     Runs fast page signals and selects the best representation type.
-    Signal results are cached per URL origin for _CACHE_TTL seconds.
+    Signal results are cached per URL origin for _CACHE_TTL seconds, for at
+    most _CACHE_MAX_ORIGINS origins.
     """
 
     def __init__(self, *, override: Callable[[PageSignals], RepresentationType] | None = None) -> None:
         self._extractor = SignalExtractor()
         self._strategy = RepresentationStrategy()
         self._override = override
-        # origin → (signals, timestamp)
-        self._cache: dict[str, tuple[PageSignals, float]] = {}
+        # origin → (signals, timestamp), least recently used first
+        self._cache: OrderedDict[str, tuple[PageSignals, float]] = OrderedDict()
 
     async def select(self, page: Page) -> RepresentationType:
         """Extract signals (with caching) and return the chosen representation type."""
@@ -51,10 +55,14 @@ class AdaptiveRouter:
             if now - ts < _CACHE_TTL:
                 # Return cached signals but update URL (may have changed within same origin)
                 cached_signals.url = page.url
+                self._cache.move_to_end(origin)
                 return cached_signals
 
         signals = await self._extractor.extract(page)
         self._cache[origin] = (signals, now)
+        self._cache.move_to_end(origin)
+        if len(self._cache) > _CACHE_MAX_ORIGINS:
+            self._cache.popitem(last=False)
         return signals
 
     def invalidate_cache(self, url: str | None = None) -> None:
@@ -66,5 +74,4 @@ class AdaptiveRouter:
 
     @staticmethod
     def _origin(url: str) -> str:
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}"
+        return url_origin(url)
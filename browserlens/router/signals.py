@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
-from playwright.async_api import Page
-
 from browserlens.core.types import PageSignals
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 # Interactive element selectors (used for a11y coverage calculation)
 _INTERACTIVE_SELECTORS = (
     "a[href], button, input, select, textarea, "
@@ -0,0 +1,49 @@
+"""Tests for the benchmark helpers."""
+
+from __future__ import annotations
+
+from browserlens.benchmarks.token_counter import TokenCounter
+from browserlens.formatter.token_budget import TokenBudget
+
+
+# ---------------------------------------------------------------------------
+# TokenCounter
+# ---------------------------------------------------------------------------
+
+class TestTokenCounter:
+    def setup_method(self):
+        self.counter = TokenCounter()
+        self.budget = TokenBudget()
+
+    def test_immediate_record_returns_count(self):
+        tokens = self.counter.record(1, "u", "hello world", "a11y_tree", False)
+        assert tokens == self.budget.count("hello world")
+        assert [r.tokens for r in self.counter.records] == [tokens]
+
+    def test_deferred_records_stay_internal_until_materialized(self):
+        assert self.counter.record(1, "u", "some text here", "a11y_tree", False, defer=True) is None
+        assert self.counter.records == []
+        assert self.counter.total_tokens == self.budget.count("some text here")
+        assert len(self.counter.records) == 1
+
+    def test_mixed_records_keep_step_order(self):
+        texts = ["first step text", "second", "third step", "fourth one here"]
+        for step, text in enumerate(texts, 1):
+            self.counter.record(step, "u", text, "a11y_tree", step % 2 == 0, defer=step != 2)
+        summary = self.counter.summary()
+        assert [r.step for r in self.counter.records] == [1, 2, 3, 4]
+        assert [r.tokens for r in self.counter.records] == [self.budget.count(t) for t in texts]
+        assert summary["total_tokens"] == sum(self.budget.count(t) for t in texts)
+        assert summary["delta_steps"] == 2
+
+    def test_materialize_with_nothing_deferred(self):
+        assert self.counter.total_tokens == 0
+        assert self.counter.avg_tokens_per_step == 0.0
+        assert self.counter.max_tokens_per_step == 0
+        self.counter.record(1, "u", "x y z", "a11y_tree", False)
+        assert self.counter.total_tokens == self.budget.count("x y z")
+
+    def test_reset_drops_pending(self):
+        self.counter.record(1, "u", "text", "a11y_tree", False, defer=True)
+        self.counter.reset()
+        assert self.counter.total_tokens == 0
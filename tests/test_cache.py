@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
@@ -72,6 +73,37 @@ class TestWorkflowCache:
         assert loaded is not None
         assert loaded.source_trace is None
 
+    # ------------------------------------------------------------------ batched saves
+
+    def test_save_many_indexes_all(self):
+        saved = self.cache.save_many([
+            (make_workflow(wf_id="b1", task="task one"), self.script_source),
+            (make_workflow(wf_id="b2", task="task two"), self.script_source),
+        ])
+        assert [wf.workflow_id for wf in saved] == ["b1", "b2"]
+        with open(os.path.join(self.tmpdir, "index.json")) as f:
+            index = json.load(f)
+        assert {"b1", "b2"} <= set(index)
+
+    def test_deferred_index_flushed_on_exit(self):
+        index_path = os.path.join(self.tmpdir, "index.json")
+        with self.cache:
+            self.cache.save(make_workflow(wf_id="d1", task="deferred task"), self.script_source)
+            assert not os.path.exists(index_path)
+            # Reads inside the block see the pending entry
+            assert self.cache.lookup_by_task("deferred task") is not None
+        with open(index_path) as f:
+            assert "d1" in json.load(f)
+
+    def test_unchanged_index_not_rewritten(self):
+        index_path = os.path.join(self.tmpdir, "index.json")
+        wf = make_workflow(wf_id="same")
+        self.cache.save(wf, self.script_source)
+        before = os.stat(index_path).st_ino
+        self.cache.save(wf, self.script_source)
+        # An atomic rewrite would have replaced the file with a new inode
+        assert os.stat(index_path).st_ino == before
+
     # ------------------------------------------------------------------ lookup_by_task
 
     def test_lookup_by_task_matches_exact(self):
@@ -103,6 +135,13 @@ class TestWorkflowCache:
         assert result is not None
         assert result.workflow_id == "wf2"
 
+    def test_lookup_by_task_after_delete_returns_none(self):
+        wf = make_workflow(wf_id="gone", task="order pizza")
+        self.cache.save(wf, self.script_source)
+        assert self.cache.lookup_by_task("order pizza") is not None
+        self.cache.delete("gone")
+        assert self.cache.lookup_by_task("order pizza") is None
+
     def test_lookup_by_task_no_match_returns_none(self):
         assert self.cache.lookup_by_task("something nobody saved") is None
 
@@ -128,6 +167,14 @@ class TestWorkflowCache:
     def test_delete_nonexistent_returns_false(self):
         assert self.cache.delete("ghost_id") is False
 
+    def test_delete_many_removes_existing_ids(self):
+        for wf_id in ("m1", "m2", "m3"):
+            self.cache.save(make_workflow(wf_id=wf_id), self.script_source)
+        assert self.cache.delete_many(["m1", "m3", "ghost_id"]) == 2
+        with open(os.path.join(self.tmpdir, "index.json")) as f:
+            assert set(json.load(f)) == {"m2"}
+        assert not os.path.isfile(os.path.join(self.tmpdir, "m1.py"))
+
     # ------------------------------------------------------------------ corrupted index
 
     def test_corrupted_index_returns_none_gracefully(self):
@@ -145,6 +192,45 @@ class TestWorkflowCache:
         workflows = self.cache.list_workflows()
         assert workflows == []
 
+    def test_index_reloaded_after_external_write(self):
+        wf = make_workflow(wf_id="stale", task="old task")
+        self.cache.save(wf, self.script_source)
+        assert self.cache.lookup_by_task("old task") is not None
+        # Another process rewrites the index behind this instance's back
+        index_path = os.path.join(self.tmpdir, "index.json")
+        with open(index_path, "w") as f:
+            json.dump({}, f)
+        assert self.cache.lookup_by_task("old task") is None
+        assert self.cache.list_workflows() == []
+
+    def test_index_write_uses_unique_temp_and_cleans_up(self):
+        wf = make_workflow()
+        temps = []
+        real_replace = os.replace
+
+        def failing_replace(src, dst):
+            temps.append(src)
+            raise OSError("disk full")
+
+        with patch("browserlens.compiler.cache.os.replace", failing_replace):
+            with pytest.raises(OSError):
+                self.cache.save(wf, self.script_source)
+        assert not any(name.endswith(".tmp") for name in os.listdir(self.tmpdir))
+        with patch("browserlens.compiler.cache.os.replace", lambda src, dst: temps.append(src) or real_replace(src, dst)):
+            self.cache.save(wf, self.script_source)
+        assert len(set(temps)) == len(temps)
+
+    def test_resave_after_other_instance_delete_rewrites_index(self):
+        wf = make_workflow(wf_id="shared")
+        other = WorkflowCache(cache_dir=self.tmpdir)
+        self.cache.save(wf, self.script_source)
+        assert other.delete("shared")
+        # Same index bytes this instance wrote before, but the file on disk changed since
+        self.cache.save(wf, self.script_source)
+        with open(os.path.join(self.tmpdir, "index.json")) as f:
+            assert "shared" in json.load(f)
+        assert [w["workflow_id"] for w in other.list_workflows()] == ["shared"]
+
     # ------------------------------------------------------------------ list_workflows
 
     def test_list_workflows_returns_all(self):
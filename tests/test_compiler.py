@@ -71,6 +71,14 @@ def make_trace(steps=None, task="log in to example.com") -> WorkflowTrace:
     )
 
 
+def _steps_literal(src: str) -> list[dict]:
+    """Evaluate the module-level STEPS literal from compiled source."""
+    for node in ast.parse(src).body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "STEPS":
+            return ast.literal_eval(node.value)
+    raise AssertionError("STEPS not found")
+
+
 class TestWorkflowCompiler:
     def setup_method(self):
         self.compiler = WorkflowCompiler()
@@ -114,6 +122,23 @@ class TestWorkflowCompiler:
         _, src = self._compile()
         ast.parse(src)  # raises SyntaxError on bad source
 
+    def test_source_valid_with_quotes_and_newlines(self):
+        steps = [
+            make_navigate_step(url='https://example.com/?q="x"'),
+            make_type_step(value='say "hi"\nbye'),
+            TraceStep(
+                step_index=2,
+                action=ActionType.CLICK,
+                target=make_target(role="button", name='Log "in"\tnow'),
+                value=None,
+                url_before="https://example.com",
+            ),
+        ]
+        slots = [ParameterSlot(name="greeting", step_indices=[1], default_value='say "hi"')]
+        _, src = self._compile(make_trace(steps=steps), slots=slots)
+        ast.parse(src)
+        assert 'params.get("greeting", "say \\"hi\\"\\nbye")' in src
+
     # ------------------------------------------------------------------ parameter slots
 
     def test_parameter_slot_replaces_literal(self):
@@ -186,9 +211,20 @@ class TestWorkflowCompiler:
     def test_steps_list_has_correct_count(self):
         trace = make_trace(steps=[make_navigate_step(), make_click_step()])
         _, src = self._compile(trace)
-        # Count entries — each has "index":
-        assert src.count('"index":') == 2
+        assert len(_steps_literal(src)) == 2
 
     def test_steps_list_contains_action_type(self):
         _, src = self._compile(make_trace(steps=[make_navigate_step()]))
-        assert '"navigate"' in src
+        assert _steps_literal(src)[0]["action"] == "navigate"
+
+    def test_steps_list_round_trips_target(self):
+        _, src = self._compile(make_trace(steps=[make_click_step()]))
+        assert _steps_literal(src)[0]["target"] == {"role": "button", "name": "Login"}
+
+    def test_selectors_by_step_matches_step_selectors(self):
+        _, src = self._compile(make_trace())
+        namespace: dict = {}
+        exec(compile(src, "<wf>", "exec"), namespace)
+        table = namespace["_SELECTORS_BY_STEP"]
+        assert set(table) == {1, 2}  # navigate step has no target
+        assert table[2]["role_name"] == "button::Login"
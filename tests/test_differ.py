@@ -6,7 +6,7 @@ from browserlens.core.types import Delta, PageState, RepresentationType, StateNo
 from browserlens.differ.differ import StateDiffer
 from browserlens.differ.semantic_filter import SemanticFilter
 from browserlens.differ.snapshot_store import SnapshotStore
-from browserlens.differ.tree_diff import diff_trees
+from browserlens.differ.tree_diff import diff_trees, index_tree
 
 
 # ---------------------------------------------------------------------------
@@ -107,6 +107,30 @@ class TestTreeDiff:
         assert len(delta.changed) == 1
         assert "disabled" in delta.changed[0].changed_props
 
+    def test_noise_filter_applied_during_diff(self):
+        old_root = make_node("@e1", "main", "")
+        new_root = make_node("@e1", "main", "", children=[
+            make_node("@e2", "text", "12:30"),
+            make_node("@e3", "button", "Submit"),
+        ])
+        delta = diff_trees(
+            old_root, new_root, step=2, rep_type=RepresentationType.A11Y_TREE,
+            noise_filter=SemanticFilter(),
+        )
+        assert [n.ref for n in delta.added] == ["@e3"]
+        # Filtered nodes still count as changes, not as unchanged
+        assert delta.unchanged_count == 1
+
+    def test_root_hash_tracks_deep_changes(self):
+        def tree(value: str) -> StateNode:
+            return make_node("@e1", "main", "", children=[
+                make_node("@e2", "form", "Search", children=[
+                    make_node("@e3", "textbox", "Query", value=value),
+                ]),
+            ])
+        assert index_tree(tree("")).root_hash == index_tree(tree("")).root_hash
+        assert index_tree(tree("")).root_hash != index_tree(tree("x")).root_hash
+
 
 # ---------------------------------------------------------------------------
 # SemanticFilter
@@ -169,6 +193,15 @@ class TestStateDiffer:
         delta = differ.diff(state)
         assert delta.is_full_state
 
+    def test_full_state_counts_every_node(self):
+        state = make_state(make_node("@e1", "main", "", children=[
+            make_node("@e2", "list", "", children=[make_node("@e3", "listitem", "A")]),
+            make_node("@e4", "button", "Go"),
+        ]))
+        delta = StateDiffer().diff(state)
+        assert delta.unchanged_count == state.node_count == len(state.flat_nodes()) == 4
+        assert [n.ref for n in state.iter_nodes()] == ["@e1", "@e2", "@e3", "@e4"]
+
     def test_second_step_returns_delta(self):
         differ = StateDiffer()
         state1 = make_state(make_node("@e1", "main", ""), step=1)
@@ -187,3 +220,34 @@ class TestStateDiffer:
         differ.reset()
         delta = differ.diff(state)
         assert delta.is_full_state
+
+    def test_unchanged_summary_lists_stable_landmarks(self):
+        def page(search_value: str, step: int) -> PageState:
+            nav = make_node("@e2", "navigation", "Main", children=[
+                make_node("@e3", "link", "Home"),
+                make_node("@e4", "link", "About"),
+            ])
+            form = make_node("@e5", "form", "Search", children=[
+                make_node("@e6", "textbox", "Query", value=search_value),
+            ])
+            return make_state(make_node("@e1", "main", "", children=[nav, form]), step=step)
+
+        differ = StateDiffer()
+        differ.diff(page("", 1))
+        delta = differ.diff(page("laptop", 2))
+        assert delta.unchanged_summary == "Main (2 items) — unchanged"
+
+    def test_previous_index_reused(self, monkeypatch):
+        from browserlens.differ import differ as differ_mod
+        calls = []
+        real = differ_mod.index_tree
+        monkeypatch.setattr(differ_mod, "index_tree", lambda root: calls.append(root) or real(root))
+        differ = StateDiffer()
+        root = make_node("@e1", "main", "", children=[make_node("@e2", "button", "Go")])
+        differ.diff(make_state(root, step=1))
+        differ.diff(make_state(root, step=2))
+        delta = differ.diff(make_state(root, step=3))
+        assert delta.is_empty
+        assert delta.unchanged_count == 2
+        # Steps 2 and 3 each index only the new tree
+        assert len(calls) == 2
@@ -160,3 +160,37 @@ class TestWorkflowExecutor:
         page = make_page()
         result = await self.executor.execute(meta.workflow_id, page)
         assert result.steps_succeeded == result.steps_executed
+
+    # ------------------------------------------------------------------ module cache
+
+    async def test_module_reused_across_runs(self):
+        meta = self._compile_and_cache(make_trace(steps=[make_navigate_step()]))
+        first, _ = self.executor._load_module(meta.script_path, meta.workflow_id)
+        await self.executor.execute(meta.workflow_id, make_page())
+        assert self.executor._load_module(meta.script_path, meta.workflow_id)[0] is first
+
+    async def test_module_reloaded_when_script_changes(self):
+        meta = self._compile_and_cache(make_trace(steps=[make_navigate_step(url="https://a.com")]))
+        await self.executor.execute(meta.workflow_id, make_page())
+        _, src = self.compiler.compile(
+            make_trace(steps=[make_navigate_step(url="https://b.example.com")]),
+            workflow_id=meta.workflow_id,
+            output_dir=self.tmpdir,
+        )
+        self.cache.save(meta, src)
+        page = make_page()
+        await self.executor.execute(meta.workflow_id, page)
+        page.goto.assert_awaited_once_with("https://b.example.com")
+
+    async def test_precompiled_module_used_on_first_run(self):
+        import types
+
+        meta, src = self.compiler.compile(make_trace(steps=[make_navigate_step()]), output_dir=self.tmpdir)
+        module = types.ModuleType("precompiled")
+        exec(compile(src, meta.script_path, "exec"), module.__dict__)
+        saved = self.cache.save(meta, src, precompiled_module=module)
+        result = await self.executor.execute(saved.workflow_id, make_page())
+        assert result.success
+        assert self.executor._load_module(saved.script_path, saved.workflow_id)[0] is module
+        # The caller's module isn't modified
+        assert not hasattr(module, "_BL_STEPS")
@@ -1,9 +1,16 @@
 """Tests for extractor utilities that don't require a live browser."""
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
+from browserlens.core.page_script import PageScript
 from browserlens.extractors._cdp import _build_tree, _convert_node, _is_interesting
+from browserlens.extractors._images import downscale_jpeg
+from browserlens.extractors.a11y import A11yExtractor
 from browserlens.extractors.dom import DOMExtractor
+from browserlens.extractors.hybrid import _CANVAS_BOXES, HybridExtractor
 from browserlens.formatter.ref_manager import RefManager
 
 
@@ -137,6 +144,19 @@ class TestCDPConversion:
         root_b = _build_tree(nodes, self.rm)
         assert root_a.children[0].ref == root_b.children[0].ref
 
+    def test_deep_tree_does_not_recurse(self):
+        depth = 3000  # well past the default recursion limit
+        nodes = [_cdp_node("0", "RootWebArea", "", internal=True, child_ids=["1"])]
+        for i in range(1, depth):
+            nodes.append(_cdp_node(str(i), "group", f"g{i}", parent_id=str(i - 1), child_ids=[str(i + 1)]))
+        nodes.append(_cdp_node(str(depth), "button", "Deep", parent_id=str(depth - 1)))
+        root = _build_tree(nodes, self.rm)
+        node = root
+        while node.children:
+            node = node.children[0]
+        assert node.name == "Deep"
+        assert root.to_dict()["children"][0]["name"] == "g1"
+
 
 class TestIsInteresting:
     def _node(self, role, name="", children=None):
@@ -203,3 +223,161 @@ class TestDOMExtractor:
         }
         node = self.ext._convert_node(raw)
         assert node.expanded is None
+
+    def test_build_tree_links_flat_list_by_parent_index(self):
+        flat = [
+            {"parent": -1, "role": "main", "name": ""},
+            {"parent": 0, "role": "list", "name": ""},
+            {"parent": 1, "role": "listitem", "name": "A", "checked": False},
+            {"parent": 0, "role": "button", "name": "Go", "disabled": True},
+        ]
+        root = self.ext._build_tree(flat)
+        assert [c.role for c in root.children] == ["list", "button"]
+        item = root.children[0].children[0]
+        assert item.name == "A" and item.checked is False and item.value == ""
+        assert root.children[1].disabled
+        # Fingerprints use the parent's role, as with nested conversion
+        assert self.rm.lookup(item.ref) == ("listitem", "A", "list")
+
+    def test_build_tree_empty_page(self):
+        assert self.ext._build_tree([]).role == "generic"
+
+
+# ---------------------------------------------------------------------------
+# A11yExtractor.extract (mocked page)
+# ---------------------------------------------------------------------------
+
+class TestA11yExtractor:
+    async def test_title_fetched_while_ax_tree_in_flight(self):
+        title_started = asyncio.Event()
+
+        async def send(method):
+            # Only completes if the title was requested without waiting on us
+            await asyncio.wait_for(title_started.wait(), timeout=1)
+            return {"nodes": [_cdp_node("1", "button", "Go")]}
+
+        async def title():
+            title_started.set()
+            return "Page"
+
+        cdp = MagicMock(send=AsyncMock(side_effect=send), detach=AsyncMock())
+        page = MagicMock(url="https://example.com")
+        page.context.new_cdp_session = AsyncMock(return_value=cdp)
+        page.title = title
+        state = await A11yExtractor(RefManager()).extract(page)
+        assert state.title == "Page"
+        assert state.root.name == "Go"
+
+    async def test_cdp_session_reused_across_extractions(self):
+        cdp = MagicMock(send=AsyncMock(return_value={"nodes": [_cdp_node("1", "button", "Go")]}))
+        page = MagicMock(url="https://example.com", title=AsyncMock(return_value="Page"))
+        page.context.new_cdp_session = AsyncMock(return_value=cdp)
+        ext = A11yExtractor(RefManager())
+        await ext.extract(page)
+        await ext.extract(page)
+        page.context.new_cdp_session.assert_awaited_once()
+        assert cdp.send.await_count == 2
+
+    async def test_stale_cdp_session_replaced(self):
+        stale = MagicMock(send=AsyncMock(side_effect=Exception("Target closed")), detach=AsyncMock())
+        fresh = MagicMock(send=AsyncMock(return_value={"nodes": [_cdp_node("1", "button", "Go")]}))
+        page = MagicMock(url="https://example.com", title=AsyncMock(return_value="Page"))
+        page.context.new_cdp_session = AsyncMock(side_effect=[stale, fresh])
+        state = await A11yExtractor(RefManager()).extract(page)
+        assert state.root.name == "Go"
+        stale.detach.assert_awaited_once()
+
+    async def test_protocol_error_not_retried(self):
+        cdp = MagicMock(send=AsyncMock(side_effect=Exception("Accessibility domain not enabled")))
+        page = MagicMock(url="https://example.com", title=AsyncMock(return_value="Page"))
+        page.context.new_cdp_session = AsyncMock(return_value=cdp)
+        with pytest.raises(Exception, match="not enabled"):
+            await A11yExtractor(RefManager()).extract(page)
+        page.context.new_cdp_session.assert_awaited_once()
+
+    async def test_concurrent_first_calls_share_one_session(self):
+        cdp = MagicMock(send=AsyncMock(return_value={"nodes": [_cdp_node("1", "button", "Go")]}))
+
+        async def new_session(page):
+            await asyncio.sleep(0)
+            return cdp
+
+        page = MagicMock(url="https://example.com", title=AsyncMock(return_value="Page"))
+        page.context.new_cdp_session = AsyncMock(side_effect=new_session)
+        ext = A11yExtractor(RefManager())
+        await asyncio.gather(ext.extract(page), ext.extract(page))
+        page.context.new_cdp_session.assert_awaited_once()
+
+
+class TestHybridExtractor:
+    async def test_title_comes_from_canvas_scan(self):
+        cdp = MagicMock(send=AsyncMock(return_value={"nodes": [_cdp_node("1", "button", "Go")]}))
+        page = MagicMock(url="https://example.com", title=AsyncMock())
+        page.context.new_cdp_session = AsyncMock(return_value=cdp)
+        page.add_init_script = AsyncMock()
+        page.evaluate = AsyncMock(
+            side_effect=lambda js, *args: {"title": "Chart", "boxes": []} if js == _CANVAS_BOXES._call_js else None
+        )
+        state = await HybridExtractor(RefManager()).extract(page)
+        assert state.title == "Chart"
+        assert state.screenshot_b64 is None
+        page.title.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# PageScript (mocked page)
+# ---------------------------------------------------------------------------
+
+class TestPageScript:
+    def setup_method(self):
+        self.script = PageScript("__blTest", "() => []")
+
+    def _page(self, result):
+        page = MagicMock()
+        page.add_init_script = AsyncMock()
+        page.evaluate = AsyncMock(
+            side_effect=lambda js, *args: result if js == self.script._call_js else None
+        )
+        return page
+
+    async def test_installed_once_then_called_by_name(self):
+        page = self._page([1])
+        assert await self.script.call(page) == [1]
+        assert await self.script.call(page) == [1]
+        page.add_init_script.assert_awaited_once()
+        # install + call on the first call, a single call on the second
+        assert page.evaluate.await_count == 3
+
+    async def test_call_many_maps_in_one_round_trip(self):
+        page = self._page([1])
+        self.script._installed.add(page)
+        page.evaluate = AsyncMock(return_value=[[1], [2]])
+        assert await self.script.call_many(page, ["a", "b"]) == [[1], [2]]
+        page.evaluate.assert_awaited_once_with(self.script._call_many_js, ["a", "b"])
+
+    async def test_reinstalls_when_document_lost_function(self):
+        page = self._page([1])
+        await self.script.call(page)
+        results = iter([None, [2]])
+        page.evaluate = AsyncMock(
+            side_effect=lambda js, *args: next(results) if js == self.script._call_js else None
+        )
+        assert await self.script.call(page) == [2]
+
+
+# ---------------------------------------------------------------------------
+# downscale_jpeg
+# ---------------------------------------------------------------------------
+
+class TestDownscaleJpeg:
+    async def test_no_limit_returns_input(self):
+        data = b"\xff\xd8not-really-a-jpeg"
+        assert await downscale_jpeg(data, None) is data
+
+    async def test_shrinks_longer_side(self):
+        Image = pytest.importorskip("PIL.Image")
+        import io
+        buf = io.BytesIO()
+        Image.new("RGB", (2000, 500), "red").save(buf, format="JPEG")
+        out = await downscale_jpeg(buf.getvalue(), 1000)
+        assert Image.open(io.BytesIO(out)).size == (1000, 250)
@@ -75,6 +75,11 @@ class TestTokenBudget:
         tb = TokenBudget()
         assert tb.count("") == 0 or tb.count("") >= 0  # depends on tiktoken
 
+    def test_count_batch_matches_count(self):
+        tb = TokenBudget()
+        texts = ["Hello world", "a longer sentence with several words", ""]
+        assert tb.count_batch(texts) == [tb.count(t) for t in texts]
+
     def test_truncate_short_text(self):
         tb = TokenBudget()
         text = "short text"
@@ -89,6 +94,56 @@ class TestTokenBudget:
         assert was_truncated
         assert "[... truncated" in truncated
 
+    @pytest.fixture
+    def fake_encoding(self, monkeypatch):
+        from browserlens.formatter import token_budget
+
+        class FakeEncoding:
+            """Whitespace tokenizer standing in for tiktoken."""
+
+            calls = 0
+
+            def encode_ordinary(self, text):
+                FakeEncoding.calls += 1
+                return text.split()
+
+            def decode(self, tokens):
+                return " ".join(tokens)
+
+        monkeypatch.setattr(token_budget, "_TIKTOKEN_AVAILABLE", True)
+        monkeypatch.setattr(token_budget, "_encoding", FakeEncoding)
+        return FakeEncoding
+
+    def test_repeated_count_encodes_once(self, fake_encoding):
+        tb = TokenBudget()
+        text = "one two three"
+        assert tb.count(text) == tb.count(text) == 3
+        assert tb.truncate(text, max_tokens=10) == (text, False)
+        assert tb.fits(text, 3)
+        assert fake_encoding.calls == 1
+        assert not any(isinstance(part, str) for part in tb._last)  # text itself isn't retained
+        tb.count("four")
+        assert fake_encoding.calls == 2
+
+    def test_truncate_by_ratio_fills_budget(self, fake_encoding):
+        tb = TokenBudget()
+        text = " ".join(["word"] * 1000)
+        truncated, was_truncated = tb.truncate(text, max_tokens=50)
+        assert was_truncated
+        body = truncated.split("\n[... truncated")[0]
+        assert text.startswith(body)
+        assert tb.count(body) == 50
+        # full count, one prefix encode, then the count above
+        assert fake_encoding.calls == 3
+
+    def test_truncate_by_ratio_short_estimate_falls_back(self, fake_encoding):
+        tb = TokenBudget()
+        # Long words up front make the chars-per-token estimate undershoot
+        text = " ".join(["x" * 20] * 30 + ["y"] * 1000)
+        truncated, _ = tb.truncate(text, max_tokens=50)
+        body = truncated.split("\n[... truncated")[0]
+        assert tb.count(body) == 50
+
     def test_fits(self):
         tb = TokenBudget()
         assert tb.fits("hi", 1000)
@@ -160,6 +215,20 @@ class TestOutputFormatter:
         assert "CHANGED" in text
         assert "laptop" in text
 
+    def test_nested_nodes_render_in_preorder(self):
+        child = make_node("@e2", "list", "", children=[make_node("@e3", "listitem", "One", checked=True)])
+        root = make_node("@e1", "main", "", children=[child, make_node("@e4", "button", "Go")])
+        delta = Delta(step=2, added=[child], is_full_state=False, representation_type=RepresentationType.A11Y_TREE)
+        full, _ = self.fmt.format(make_state(root), None)
+        assert full.splitlines()[5:] == [
+            "- main [@e1]",
+            "  - list [@e2]",
+            "    - listitem \"One\" [@e3] (checked: True)",
+            "  - button \"Go\" [@e4]",
+        ]
+        text, _ = self.fmt.format(make_state(root, step=2), delta)
+        assert text.splitlines()[3:] == ["ADDED:", "  - list [@e2]", "    - listitem \"One\" [@e3] (checked: True)"]
+
     def test_token_count_returned(self):
         state = make_state(make_node("@e1", "button", "Click me"), step=1)
         text, token_count = self.fmt.format(state, None)
@@ -170,3 +239,18 @@ class TestOutputFormatter:
         state = make_state(make_node("@e1", "main", ""), step=1)
         text, _ = self.fmt.format(state, delta)
         assert "[FULL PAGE STATE" in text
+
+    def test_format_tokenizes_once_within_budget(self, monkeypatch):
+        calls = []
+        count = self.fmt._budget.count
+        monkeypatch.setattr(self.fmt._budget, "count", lambda t: calls.append(t) or count(t))
+        state = make_state(make_node("@e1", "button", "Submit"), step=1)
+        self.fmt.format_full(state)
+        assert len(calls) == 1
+
+    def test_format_truncates_over_budget(self):
+        fmt = OutputFormatter(ref_manager=self.rm, token_budget=5)
+        children = [make_node(f"@e{i}", "button", f"Button {i}") for i in range(50)]
+        state = make_state(make_node("@e0", "main", "", children=children), step=1)
+        text, _ = fmt.format(state, None)
+        assert text.endswith("[... truncated to fit token budget ...]")
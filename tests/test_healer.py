@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 import importlib.util
+import inspect
 import os
 import sys
 import tempfile
@@ -95,6 +97,16 @@ async def step_0(page, **params):
         assert result == {}
 
 
+    def test_accepts_function_def_node(self):
+        src = '''
+async def step_0(page, **params):
+    _selectors = {"test_id": "submit"}
+    el = await find_element(page, _selectors)
+'''
+        fn = ast.parse(src).body[0]
+        assert _extract_selectors_from_ast(fn) == {"test_id": "submit"}
+
+
 class TestHealerLevel1:
     def setup_method(self):
         self.lens_mock = MagicMock()
@@ -145,6 +157,81 @@ async def step_0(page, **params):
         assert level == 1
 
 
+    async def test_level1_parses_step_source_once(self):
+        src = """
+async def step_0(page, **params):
+    _selectors = {"css": "button.bad"}
+    el = await find_element(page, _selectors)
+    await el.click()
+"""
+        module = make_minimal_module(src, wf_id="parse_once")
+
+        async def fail_find(pg, selectors, timeout=5000):
+            raise Exception("no element")
+
+        module.find_element = fail_find
+        meta = {"index": 0, "action": "click", "target": None}
+        with patch("browserlens.compiler.healer.inspect.getsource", wraps=inspect.getsource) as spy:
+            await self.healer.heal(AsyncMock(), meta, module, {}, Exception("fail"))
+            await self.healer.heal(AsyncMock(), meta, module, {}, Exception("fail"))
+        assert spy.call_count == 1
+
+
+    async def test_level1_prefers_selectors_table(self):
+        module = types.ModuleType("no_source")
+        module._SELECTORS_BY_STEP = {0: {"css": "button.bad", "role_name": "button::Submit"}}
+        module.step_0 = AsyncMock()
+        probed = []
+
+        async def mock_find(pg, selectors, timeout=5000):
+            probed.append(selectors)
+            if "role_name" in selectors:
+                return MagicMock()
+            raise Exception("css failed")
+
+        module.find_element = mock_find
+        healed, level = await self.healer.heal(
+            AsyncMock(), make_step_meta(), module, {}, Exception("original")
+        )
+        assert (healed, level) == (True, 1)
+        assert probed == [{"css": "button.bad"}, {"role_name": "button::Submit"}]
+
+
+    async def test_level1_probes_strategies_concurrently(self):
+        module = types.ModuleType("concurrent")
+        module._SELECTORS_BY_STEP = {0: {"css": "button.slow", "role_name": "button::Submit"}}
+        module.step_0 = AsyncMock()
+
+        async def mock_find(pg, selectors, timeout=5000):
+            if "css" in selectors:
+                await asyncio.sleep(30)  # would time out; must not block the heal
+            return MagicMock()
+
+        module.find_element = mock_find
+        healed, level = await asyncio.wait_for(
+            self.healer.heal(AsyncMock(), make_step_meta(), module, {}, Exception("x")),
+            timeout=5,
+        )
+        assert (healed, level) == (True, 1)
+        module.step_0.assert_awaited_once()
+
+
+    async def test_level1_falls_through_when_rerun_fails(self):
+        module = types.ModuleType("fallthrough")
+        module._SELECTORS_BY_STEP = {0: {"test_id": "submit", "css": "button.go"}}
+        module.step_0 = AsyncMock(side_effect=[Exception("still broken"), None])
+
+        async def mock_find(pg, selectors, timeout=5000):
+            return MagicMock()
+
+        module.find_element = mock_find
+        healed, level = await self.healer.heal(
+            AsyncMock(), make_step_meta(), module, {}, Exception("original")
+        )
+        assert (healed, level) == (True, 1)
+        assert module.step_0.await_count == 2
+
+
 class TestHealerLevel2:
     def setup_method(self):
         self.lens_mock = MagicMock()
@@ -210,6 +297,19 @@ async def step_0(page, **params):
         assert level == 2
 
 
+    async def test_level2_fails_when_element_absent(self):
+        module = types.ModuleType("absent")
+        module.step_0 = AsyncMock()
+        state = make_state_with_node(role="button", name="Cancel")
+        self.lens_mock.observe = AsyncMock(return_value=MagicMock(page_state=state))
+        healed = await self.healer._heal_level2(
+            AsyncMock(), module.step_0, {}, "button", "Submit"
+        )
+        assert healed is False
+        module.step_0.assert_not_awaited()
+        assert state.has_node("button", "Cancel")
+
+
 class TestHealerLevel3:
     def setup_method(self):
         self.lens_mock = MagicMock()
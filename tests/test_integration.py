@@ -153,3 +153,76 @@ class TestBrowserLensObserve:
         result = await lens.observe(page)
         assert result.delta is None
         assert "[FULL PAGE STATE" in result.formatted_text
+
+
+class TestObservationCache:
+    def _setup(self, dom_versions):
+        lens = BrowserLens(enable_routing=False, enable_observation_cache=True)
+        state = make_state(make_node("@e1", "main", "", children=[
+            make_node("@e2", "button", "Go"),
+        ]))
+        extractor = lens._extractors[RepresentationType.A11Y_TREE]
+        extractor.extract = AsyncMock(return_value=state)
+        page = MagicMock()
+        page.url = "https://example.com"
+        page.evaluate = AsyncMock(side_effect=[[1.0, v] for v in dom_versions])
+        return lens, extractor, page
+
+    @pytest.mark.asyncio
+    async def test_unchanged_page_reuses_extraction(self):
+        lens, extractor, page = self._setup([0, 0])
+        await lens.observe(page)
+        result = await lens.observe(page)
+        extractor.extract.assert_awaited_once()
+        assert result.step == 2
+        assert result.page_state.step == 2
+        assert result.delta.is_empty
+        assert "[DELTA — step 2" in result.formatted_text
+
+    @pytest.mark.asyncio
+    async def test_dom_change_re_extracts(self):
+        lens, extractor, page = self._setup([0, 1])
+        await lens.observe(page)
+        await lens.observe(page)
+        assert extractor.extract.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_representation_change_re_extracts(self):
+        lens, extractor, page = self._setup([0, 0])
+        dom_state = make_state(make_node("@e1", "main", ""))
+        dom_state.representation_type = RepresentationType.DISTILLED_DOM
+        dom_extractor = lens._extractors[RepresentationType.DISTILLED_DOM]
+        dom_extractor.extract = AsyncMock(return_value=dom_state)
+        await lens.observe(page)
+        lens.force_representation = RepresentationType.DISTILLED_DOM
+        result = await lens.observe(page)
+        dom_extractor.extract.assert_awaited_once()
+        assert result.representation_type == RepresentationType.DISTILLED_DOM
+
+    @pytest.mark.asyncio
+    async def test_screenshot_states_not_reused(self):
+        lens, _, page = self._setup([0, 0])
+        lens.force_representation = RepresentationType.VISION
+        state = make_state(make_node("@e1", "main", ""))
+        state.representation_type = RepresentationType.VISION
+        state.screenshot_b64 = "aGVsbG8="
+        vision = lens._extractors[RepresentationType.VISION]
+        vision.extract = AsyncMock(return_value=state)
+        await lens.observe(page)
+        await lens.observe(page)
+        assert vision.extract.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_re_extract(self):
+        lens, extractor, page = self._setup([0, 0])
+        await lens.observe(page)
+        lens.invalidate()
+        await lens.observe(page)
+        assert extractor.extract.await_count == 2
+
+
+def test_import_does_not_load_playwright():
+    import subprocess
+    import sys
+    code = "import sys, browserlens; sys.exit('playwright' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -153,3 +153,24 @@ class TestActionRecorder:
 
         trace = self.recorder.stop()
         assert trace.site_domain == "mysite.example.com"
+
+    # ------------------------------------------------------------------ record_many
+
+    async def test_record_many_generates_targets_in_one_call(self):
+        self.recorder.start("batch test")
+        page = make_page()
+
+        targets = [make_element_target(name="First"), make_element_target(name="Last")]
+        gen_mock = AsyncMock(return_value=targets)
+        with patch("browserlens.compiler.recorder.SelectorGenerator.generate_many", gen_mock):
+            steps = await self.recorder.record_many(page, [
+                {"action": ActionType.TYPE, "role": "textbox", "name": "First", "value": "a"},
+                {"action": ActionType.WAIT, "value": "100"},
+                {"action": ActionType.TYPE, "role": "textbox", "name": "Last", "value": "b"},
+            ])
+
+        gen_mock.assert_awaited_once()
+        assert [s.step_index for s in steps] == [0, 1, 2]
+        assert steps[0].target is targets[0]
+        assert steps[1].target is None
+        assert steps[2].target is targets[1]
@@ -1,8 +1,11 @@
 """Tests for the AdaptiveRouter and its signal/strategy components."""
 
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from browserlens.core.types import PageSignals, RepresentationType
+from browserlens.router.router import AdaptiveRouter
 from browserlens.router.strategies import RepresentationStrategy
 
 
@@ -66,3 +69,37 @@ class TestPageSignals:
     def test_origin_with_port(self):
         signals = make_signals(url="http://localhost:3000/page")
         assert signals.origin == "http://localhost:3000"
+
+    def test_origin_matches_urllib_on_edge_cases(self):
+        from urllib.parse import urlparse
+        for url in ("HTTPS://Example.com?q=1", "about:blank", " https://x.com/", "https://[::1]:8080/a"):
+            parsed = urlparse(url)
+            assert make_signals(url=url).origin == f"{parsed.scheme}://{parsed.netloc}"
+
+
+class TestAdaptiveRouterCache:
+    def setup_method(self):
+        self.router = AdaptiveRouter()
+        self.router._extractor.extract = AsyncMock(
+            side_effect=lambda page: make_signals(url=page.url)
+        )
+
+    @staticmethod
+    def page(url: str) -> MagicMock:
+        page = MagicMock()
+        page.url = url
+        return page
+
+    async def test_same_origin_extracted_once(self):
+        await self.router.get_signals(self.page("https://a.com/one"))
+        signals = await self.router.get_signals(self.page("https://a.com/two"))
+        assert self.router._extractor.extract.await_count == 1
+        assert signals.url == "https://a.com/two"
+
+    async def test_least_recently_used_origin_evicted(self):
+        with patch("browserlens.router.router._CACHE_MAX_ORIGINS", 2):
+            await self.router.get_signals(self.page("https://a.com/"))
+            await self.router.get_signals(self.page("https://b.com/"))
+            await self.router.get_signals(self.page("https://a.com/"))  # hit: a is now newest
+            await self.router.get_signals(self.page("https://c.com/"))
+        assert list(self.router._cache) == ["https://a.com", "https://c.com"]
@@ -0,0 +1,62 @@
+"""Unit tests for SelectorGenerator (mocked Playwright page)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+from browserlens.compiler.selectors import _GEN_SELECTORS, SelectorGenerator
+from browserlens.compiler.types import SelectorStrategy
+
+
+def make_page(raw: dict) -> MagicMock:
+    page = MagicMock()
+    page.add_init_script = AsyncMock()
+    page.evaluate = AsyncMock(side_effect=lambda js, *args: raw if js == _GEN_SELECTORS._call_js else None)
+    return page
+
+
+class TestSelectorGenerator:
+    def setup_method(self):
+        self.gen = SelectorGenerator()
+
+    async def test_generate_maps_raw_fields_to_strategies(self):
+        page = make_page({"test_id": "submit", "css": "button.go"})
+        target = await self.gen.generate(page, "@e1", "button", "Go")
+        assert target.selectors == {
+            SelectorStrategy.TEST_ID: "submit",
+            SelectorStrategy.ROLE_NAME: "button::Go",
+            SelectorStrategy.CSS: "button.go",
+        }
+        assert target.selector_priority == [
+            SelectorStrategy.TEST_ID,
+            SelectorStrategy.ROLE_NAME,
+            SelectorStrategy.CSS,
+        ]
+
+    async def test_script_installed_once_per_page(self):
+        page = make_page({"css": "a"})
+        await self.gen.generate(page, "@e1", "link", "Home")
+        await self.gen.generate(page, "@e2", "link", "About")
+        page.add_init_script.assert_awaited_once()
+        # install + call on the first generate, a single call on the second
+        assert page.evaluate.await_count == 3
+
+    async def test_reinstalls_when_document_lost_function(self):
+        page = make_page({"css": "a"})
+        await self.gen.generate(page, "@e1", "link", "Home")
+        calls = iter([None, {"css": "b"}])
+        page.evaluate = AsyncMock(side_effect=lambda js, *args: next(calls) if js == _GEN_SELECTORS._call_js else None)
+        target = await self.gen.generate(page, "@e2", "link", "Home")
+        assert target.selectors[SelectorStrategy.CSS] == "b"
+
+    async def test_generate_many_single_round_trip(self):
+        page = MagicMock()
+        page.add_init_script = AsyncMock()
+        page.evaluate = AsyncMock(return_value=[{"css": "a.one"}, {}])
+        _GEN_SELECTORS._installed.add(page)
+        targets = await self.gen.generate_many(
+            page, [("@e1", "link", "One", ""), ("@e2", "link", "Two", "")]
+        )
+        page.evaluate.assert_awaited_once()
+        assert targets[0].selectors[SelectorStrategy.CSS] == "a.one"
+        assert targets[1].selectors == {SelectorStrategy.ROLE_NAME: "link::Two"}